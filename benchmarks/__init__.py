@@ -0,0 +1,4 @@
+"""Throughput benchmarks for item generation, equipment and the skill grid.
+
+Run with `python -m benchmarks.run`; see that module for options.
+"""
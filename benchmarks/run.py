@@ -0,0 +1,252 @@
+"""Benchmark runner.
+
+    python -m benchmarks.run                                # all cases, table output
+    python -m benchmarks.run --json results.json            # also write JSON ("-" for stdout)
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.2
+
+Each case reports:
+- ops_per_sec: best of --repeat timed runs
+- blocks_per_op / bytes_per_op: memory blocks and bytes still allocated
+  per operation when the results are kept (traced by tracemalloc, in a
+  separate untimed run)
+- peak_rss_kib: process high-water mark after the case (None where the
+  resource module is unavailable, e.g. Windows)
+
+With --baseline the run exits with status 1 if any case's throughput
+dropped by more than --threshold (a fraction) against the baseline.
+Baselines are machine-specific; record them on the machine that compares.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+
+# name -> (setup(seed) returning a zero-argument operation, default ops per run)
+CASES = {}
+
+
+def case(name, ops):
+    def register(setup):
+        CASES[name] = (setup, ops)
+        return setup
+    return register
+
+
+@case("generate_item", ops=2_000)
+def _generate_item(seed):
+    from systems.item_generator import ItemGenerator
+
+    gen = ItemGenerator(seed=seed)
+    return lambda: gen.generateItem(ilvl=25)
+
+
+@case("create_random_affix", ops=20_000)
+def _create_random_affix(seed):
+    import random
+
+    from core.items.affixes import AffixLoader
+
+    loader = AffixLoader(rng=random.Random(seed))
+    return lambda: loader.create_random_affix("Prefix", 25, "Weapon")
+
+
+@case("get_allowed_baseTypes", ops=20_000)
+def _get_allowed_base_types(seed):
+    import random
+
+    from core.items.bases import BaseTypeLoader
+
+    loader = BaseTypeLoader()
+    rng = random.Random(seed)
+    return lambda: loader.get_allowed_baseTypes(rng.randint(1, 60), [], "random")
+
+
+@case("gear_construction", ops=5_000)
+def _gear_construction(seed):
+    import random
+
+    from core.items.affixes import AffixLoader
+    from core.items.bases import BaseType, BaseTypeLoader
+    from core.items.gear import Gear
+
+    rng = random.Random(seed)
+    base_loader = BaseTypeLoader(rng=rng)
+    affix_loader = AffixLoader(rng=rng)
+    base = base_loader.create_random_baseType(25, gearSlot="Helmet")
+    prefixes = [affix_loader.create_random_affix("Prefix", 25, base.slot)]
+    suffixes = [affix_loader.create_random_affix("Suffix", 25, base.slot)]
+    # a fresh base per item: local affixes modify it
+    return lambda: Gear(rarity="Magic", base=BaseType(base.template, 25), prefixes=prefixes, suffixes=suffixes)
+
+
+@case("character_equip", ops=20_000)
+def _character_equip(seed):
+    from itertools import cycle
+
+    from core.character import Character
+    from systems.equipment import normalize_slot
+    from systems.item_generator import ItemGenerator
+
+    character = Character("Benchmark")
+    character.lvl = 100
+    for sid in ("str", "int", "dex"):
+        character.get_stat_by_id(sid).base = 1000
+    gen = ItemGenerator(seed=seed)
+    items = []
+    while len(items) < 64:
+        item = gen.generateItem(ilvl=25)
+        if normalize_slot(item.slot) in character.equipment:
+            items.append(item)
+    pool = cycle(items)
+
+    def equip():
+        character.equip(next(pool))
+        # equip moves the replaced piece to the inventory
+        character.inventory.clear()
+    return equip
+
+
+@case("generate_cluster", ops=5_000)
+def _generate_cluster(seed):
+    from itertools import count
+
+    from game.skill_tree.generator import generate_cluster
+    from game.skill_tree.types import Affinity
+
+    biases = [None] + list(Affinity)
+    positions = count()
+
+    def generate():
+        i = next(positions)
+        return generate_cluster(seed, i % 97, i // 97, biases[i % len(biases)])
+    return generate
+
+
+def peak_rss_kib():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def measure(name, ops=None, repeat=DEFAULT_REPEAT, seed=1):
+    setup, default_ops = CASES[name]
+    ops = ops or default_ops
+    op = setup(seed)
+    for _ in range(min(ops, 100)):
+        op()
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(ops):
+            op()
+        best = min(best, time.perf_counter() - start)
+
+    # allocation profile, kept separate from the timings
+    op = setup(seed)
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    results = [op() for _ in range(ops)]
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    blocks = sys.getallocatedblocks() - blocks
+    del results
+
+    return {
+        "ops": ops,
+        "ops_per_sec": round(ops / best, 1),
+        "blocks_per_op": round(blocks / ops, 2),
+        "bytes_per_op": round(traced / ops, 1),
+        "peak_rss_kib": peak_rss_kib(),
+    }
+
+
+def run(names=None, ops=None, repeat=DEFAULT_REPEAT, seed=1):
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": {name: measure(name, ops, repeat, seed) for name in (names or CASES)},
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """Returns one message per case whose throughput regressed beyond threshold."""
+    regressions = []
+    for name, result in current["cases"].items():
+        reference = baseline.get("cases", {}).get(name)
+        if not reference:
+            continue
+        change = result["ops_per_sec"] / reference["ops_per_sec"] - 1
+        if change < -threshold:
+            regressions.append(f"{name}: {result['ops_per_sec']:.0f} ops/s vs baseline "
+                               f"{reference['ops_per_sec']:.0f} ({change:+.0%})")
+    return regressions
+
+
+def _print_results(results, baseline=None):
+    print(f"{'case':<24}{'ops/s':>12}{'vs base':>9}{'blocks/op':>11}{'bytes/op':>11}{'peak RSS KiB':>14}")
+    for name, r in results["cases"].items():
+        reference = (baseline or {}).get("cases", {}).get(name)
+        change = f"{r['ops_per_sec'] / reference['ops_per_sec'] - 1:+.0%}" if reference else "-"
+        rss = r["peak_rss_kib"] if r["peak_rss_kib"] is not None else "-"
+        print(f"{name:<24}{r['ops_per_sec']:>12.0f}{change:>9}{r['blocks_per_op']:>11}{r['bytes_per_op']:>11}{rss:>14}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the throughput benchmarks")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=None, help="Cases to run (default all)")
+    parser.add_argument("--ops", type=int, default=None, help="Operations per timed run (default per case)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per case; the best counts")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the generators")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write results as JSON ('-' for stdout)")
+    parser.add_argument("--baseline", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed throughput drop vs the baseline, as a fraction")
+    parser.add_argument("--save-baseline", dest="save_baseline", default=None, help="Write results as a new baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args.cases, args.ops, args.repeat, args.seed)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.json_path == "-":
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        _print_results(results, baseline)
+        if args.json_path:
+            with open(args.json_path, "w") as f:
+                json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,8 @@ class Bonus:
     """
     A bonus that can be added to the player stats
     """
+    __slots__ = ("sid", "add_bonus", "multi_bonus")
+
     def __init__(self, sid, add_bonus=0, multi_bonus=0):
         self.sid = sid
         self.add_bonus = add_bonus
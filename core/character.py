@@ -3,6 +3,59 @@ from __future__ import annotations
 import core.stats as Stat
 
 
+# name, sid, base[, decimals]
+STAT_DEFINITIONS = (
+    # resources
+    ("Life", "hp", 10),
+    ("Mana", "mana", 10),
+    ("Speed", "sp", 0),
+
+    # attributes
+    ("Strength", "str", 10),
+    ("Intelligence", "int", 10),
+    ("Dexterity", "dex", 10),
+
+    # offenses
+    ("Minimum physical damage", "minpd", 1),
+    ("Maximum physical damage", "maxpd", 2),
+    ("Minimum spell damage", "minsd", 2),
+    ("Maximum spell damage", "maxsd", 2),
+    ("Accuracy", "acc", 0.8),
+
+    # defenses
+    ("Armor", "armor", 0),
+    ("Fire Resistance", "fires", 0),
+    ("Shock Resistance", "shres", 0),
+    ("Frost Resistance", "frres", 0),
+    ("Chaos Resistance", "chres", 0),
+    ("Evasion", "ev", 0.2),
+
+    # misc
+    ("Gold Find", "gfin", 0),
+    ("Magic Find", "mfin", 0),
+    ("Flee Chance", "fch", 0),
+    ("Merchant prices", "mpr", 0),
+
+    # slots
+    ("Skill Slots", "ssl", 3, 0),
+    ("Habit slots", "hsl", 2, 0),
+    ("Potion slots", "psl", 1, 0),
+    ("Inventory slots", "isl", 10, 0),
+)
+
+# Bonus ids from Bases.json/Affixes.json that are not character stats themselves
+STAT_ROUTES = {
+    "all_res": ("fires", "shres", "frres", "chres"),
+    "min_pd": ("minpd",),
+    "max_pd": ("maxpd",),
+    "min_sd": ("minsd",),
+    "max_sd": ("maxsd",),
+}
+
+# Handled on the item (local implicit modifiers, requirement reducers)
+ITEM_ONLY_STATS = ("impl", "att_red", "lvl_red")
+
+
 class Character:
     def __init__(self, name: str):
         self.name = name
@@ -17,59 +70,21 @@ class Character:
         self.initialize_inventory()
 
     def initialize_stats(self):
-        self.stats = []
-
-        # resources
-        self.stats.append(Stat.Stat("Life", "hp", 10))
-        self.stats.append(Stat.Stat("Mana", "mana", 10))
-        self.stats.append(Stat.Stat("Speed", "sp", 0))
-
-        # attributes
-        self.stats.append(Stat.Stat("Strength", "str", 10))
-        self.stats.append(Stat.Stat("Intelligence", "int", 10))
-        self.stats.append(Stat.Stat("Dexterity", "dex", 10))
-
-        # offenses
-        self.stats.append(Stat.Stat("Minimum physical damage", "minpd", 1))
-        self.stats.append(Stat.Stat("Maximum physical damage", "maxpd", 2))
-        self.stats.append(Stat.Stat("Minimum spell damage", "maxsd", 2))
-        self.stats.append(Stat.Stat("Maximum spell damage", "maxsd", 2))
-        self.stats.append(Stat.Stat("Accuracy", "acc", 0.8))
-
-        # defenses
-        self.stats.append(Stat.Stat("Armor", "armor", 0))
-        self.stats.append(Stat.Stat("Fire Resistance", "fires", 0))
-        self.stats.append(Stat.Stat("Shock Resistance", "shres", 0))
-        self.stats.append(Stat.Stat("Frost Resistance", "frres", 0))
-        self.stats.append(Stat.Stat("Chaos Resistance", "chres", 0))
-        self.stats.append(Stat.Stat("Evasion", "ev", 0.2))
-
-        # misc
-        self.stats.append(Stat.Stat("Gold Find", "gfin", 0))
-        self.stats.append(Stat.Stat("Magic Find", "mfin", 0))
-        self.stats.append(Stat.Stat("Flee Chance", "fch", 0))
-        self.stats.append(Stat.Stat("Merchant prices", "mpr", 0))
-
-        # slots
-        self.stats.append(Stat.Stat("Skill Slots", "ssl", 3, decimals=0))
-        self.stats.append(Stat.Stat("Habit slots", "hsl", 2, decimals=0))
-        self.stats.append(Stat.Stat("Potion slots", "psl", 1, decimals=0))
-        self.stats.append(Stat.Stat("Inventory slots", "isl", 10, decimals=0))
+        # registry: O(1) lookup by sid/name, values in contiguous arrays
+        self.stat_registry = Stat.StatRegistry(STAT_DEFINITIONS, routes=STAT_ROUTES, ignored=ITEM_ONLY_STATS)
+        self.stats = [self.stat_registry.stat(i) for i in range(len(self.stat_registry))]
 
     def get_stat_by_name(self, name: str):
-        for stat in self.stats:
-            if stat.name == name:
-                break
-        return stat
+        """Raises core.stats.UnknownStatError for unknown names."""
+        return self.stats[self.stat_registry.index_of_name(name)]
 
     def get_stat_by_id(self, sid: str):
-        for stat in self.stats:
-            if stat.sid == sid:
-                break
-        return stat
+        """Raises core.stats.UnknownStatError for unknown ids."""
+        return self.stats[self.stat_registry.index_of(sid)]
 
     def apply_bonus_to_stat(self, bonus):
-        self.get_stat_by_id(bonus.sid).add_bonus(bonus.add_bonus, bonus.multi_bonus)
+        # routed ids (e.g. all_res) fan out; item-only ids are ignored
+        self.stat_registry.apply(bonus.sid, bonus.add_bonus, bonus.multi_bonus)
 
     def initialize_gear(self):
         self.equipment = {
@@ -82,6 +97,8 @@ class Character:
             "Amulet": None,
             "Ring": None,
         }
+        # slot -> boni currently added to the stats for the equipped piece
+        self.applied_boni = {}
 
     # Transitional wrapper: keep method but delegate to systems layer via local import
     def equip(self, gear_piece):
@@ -92,8 +109,22 @@ class Character:
         from systems import equipment as equipment_system
         return equipment_system.unequip(self, gear_slot)
 
-    def apply_gear_boni(self):
-        gear_boni = []
+    def apply_gear_boni(self, gear_slot, gear_piece):
+        """
+        Adds a gear piece's boni to the stats as a delta and remembers them,
+        so they can be retracted exactly on unequip. Returns the applied boni.
+        """
+        gear_boni = tuple(getattr(gear_piece, "boni", ()))
+        for bonus in gear_boni:
+            self.apply_bonus_to_stat(bonus)
+        self.applied_boni[gear_slot] = gear_boni
+        return gear_boni
+
+    def retract_gear_boni(self, gear_slot):
+        """Removes the boni applied for a slot. Returns the retracted boni."""
+        gear_boni = self.applied_boni.pop(gear_slot, ())
+        for bonus in gear_boni:
+            self.stat_registry.apply(bonus.sid, -bonus.add_bonus, -bonus.multi_bonus)
         return gear_boni
 
     def initialize_inventory(self):
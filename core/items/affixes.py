@@ -1,51 +1,33 @@
-import json
-import os
+import logging
 import random
-import sys
 from core import bonus as Bonus
+from core.items.catalog import AFFIX_FILE_NAME, Catalog, TemplateField, get_catalog, load_json
 
 # --- Configuration ---
-JSON_FILE_NAME = "Affixes.json"
+JSON_FILE_NAME = AFFIX_FILE_NAME
 
-def _candidate_paths(filename: str):
-    here = os.path.dirname(__file__)              # .../core/items
-    root = os.path.dirname(os.path.dirname(here)) # project root
-    return [
-        os.path.join(root, "data", filename),   # preferred location
-        os.path.join(root, filename),            # legacy root location
-    ]
+logger = logging.getLogger(__name__)
+
+# private fallback stream for affixes rolled without an explicit rng
+_default_rng = random.Random()
 
 class AffixLoader():
     
-    def __init__(self):
+    def __init__(self, catalog: Catalog | None = None, rng=None):
         
-        self.affixList = self.load_data()
+        # shared, read-only affix definitions (loaded once per process)
+        self.catalog = catalog if catalog is not None else get_catalog()
+        # private random stream (random.Random or numpy Generator)
+        self.rng = rng if rng is not None else random.Random()
+        self.affixList = self.catalog.affixes
         self.used_affixes = []
     
     def load_data(self, file_path: str | None = None):
         """
         Loads affix data from a JSON file and returns it as a Python dictionary.
+        Prefer get_catalog()/reload_catalog(), which parse the file only once.
         """
-        # Determine candidate paths (data/ then root/) unless an explicit path is provided
-        paths = [file_path] if file_path else _candidate_paths(JSON_FILE_NAME)
-        last_err = None
-        for p in paths:
-            try:
-                if p and os.path.exists(p):
-                    with open(p, 'r') as f:
-                        data = json.load(f)
-                    return data
-            except json.JSONDecodeError as e:
-                last_err = e
-                break
-            except OSError as e:
-                last_err = e
-                continue
-        if last_err:
-            print(f"Error loading affix data: {last_err}")
-        else:
-            print(f"Warning: Affix data file not found in any expected location: {paths}")
-        return {}
+        return load_json(JSON_FILE_NAME, file_path, label="affix")
         
     def get_affix_by_name(self, affixList, name):
         """
@@ -58,21 +40,15 @@ class AffixLoader():
         Retrieves a random affix from the affix list
         """
         
-        random_vague_name = random.choice(list(self.affixList.keys()))
+        names = list(self.affixList.keys())
+        random_vague_name = names[int(self.rng.random() * len(names))]
         return self.get_affix_by_name(self.affixList, random_vague_name)
     
     def get_affixes_for_slot(self, affixType, gear_slot):
         """
-        Retrieves a random prefix affix object from the restructured data.
+        Retrieves all affix objects of a type that can roll on the given slot.
         """
-        affixes = []
-        # Iterate over the values (the affix objects) in the top-level dictionary
-        for affix_obj in self.affixList.values():
-            # Check the 'type' attribute of each affix object
-            if (affix_obj.get("type") == affixType) and (gear_slot in affix_obj.get("slots")):
-                    affixes.append(affix_obj)
-    
-        return affixes
+        return list(self.catalog.affix_table(affixType, gear_slot).items)
     
     def get_affixes(self, affixType):
         """
@@ -90,51 +66,52 @@ class AffixLoader():
 
     def create_random_affix(self, affixType, ilvl, gear_slot):
         
-        js_affixes = self.get_affixes_for_slot(affixType, gear_slot)
+        js_affixes = self.catalog.affix_table(affixType, gear_slot)
 
         if not js_affixes:
-            print(f"Error: No available {affixType} affixes for {gear_slot} (all used or none defined).")
+            logger.error("No available %s affixes for %s (all used or none defined).", affixType, gear_slot)
             return None
         
-        weights = [bt['weight'] for bt in js_affixes]
-        
-        js_affix = random.choices(js_affixes, weights=weights)[0]
+        js_affix = js_affixes.pick(self.rng)
         
         # save affix to prevent double use
         self.used_affixes.append(js_affix)
         
-        return Affix(js_affix, ilvl)
+        return Affix(js_affix, ilvl, rng=self.rng)
         
         
 class Affix():
-    def __init__(self, json_affix, ilvl, roll="random"):
-        
-        # from json
-        self.typ = json_affix["type"] # string
-        self.name = json_affix["name"] # string
-        self.clearName = json_affix["clearName"] # string
-        self.slots = json_affix["slots"] # string array
-        
-        self.ph_description = json_affix["description"] # string, description placeholder
-        self.tags = json_affix["tags"] # string array
-        
-        self.xStat = json_affix["xStat"] # string array
-        self.xType = json_affix["xType"] # string
-        self.xRange = json_affix["xRange"] # int array
-        self.xValue = 0
+    __slots__ = ("template", "ilvl", "xValue", "yValue", "zValue", "_description")
 
-        # explicit scope for local/global behavior
-        self.scope = json_affix.get("scope", "global")
+    # from json (shared catalog entry, never copied per affix)
+    typ = TemplateField("type") # string
+    name = TemplateField("name") # string
+    clearName = TemplateField("clearName") # string
+    slots = TemplateField("slots") # string array
+    
+    ph_description = TemplateField("description") # string, description placeholder
+    tags = TemplateField("tags") # string array
+    
+    xStat = TemplateField("xStat") # string array
+    xType = TemplateField("xType") # string
+    xRange = TemplateField("xRange") # int array
+
+    # explicit scope for local/global behavior
+    scope = TemplateField("scope", "global")
+    
+    yStat = TemplateField("yStat", None) # string array
+    yType = TemplateField("yType", None) # string
+    yRange = TemplateField("yRange", None) # int array
+    
+    zStat = TemplateField("zStat", None) # string array
+    zType = TemplateField("zType", None) # string
+    zRange = TemplateField("zRange", None) # int array
+
+    def __init__(self, json_affix, ilvl, roll="random", rng=None):
         
-        self.yStat = json_affix.get("yStat") # string array
-        self.yType = json_affix.get("yType") # string
-        self.yRange = json_affix.get("yRange") # int array
+        self.template = json_affix
+        self.xValue = 0
         self.yValue = 0
-        
-        
-        self.zStat = json_affix.get("zStat") # string array
-        self.zType = json_affix.get("zType") # string
-        self.zRange = json_affix.get("zRange") # int array
         self.zValue = 0
         
         # intrinsic
@@ -142,46 +119,58 @@ class Affix():
         
         # roll the value
         if roll == "random":
-            roll = random.random()
+            roll = (rng if rng is not None else _default_rng).random()
         
         # calculate explicit values
-        self.xValue = (self.xRange[-1] - self.xRange[0]) * ilvl/100 * roll + self.xRange[0]
-        self.xValue = round(self.xValue)
+        xRange = self.xRange
+        self.xValue = round((xRange[-1] - xRange[0]) * ilvl/100 * roll + xRange[0])
         
         if self.yStat != None:
-            self.yValue = (self.yRange[-1] - self.yRange[0]) * ilvl/100 * roll + self.yRange[0]
-            self.yValue = round(self.yValue)
+            yRange = self.yRange
+            self.yValue = round((yRange[-1] - yRange[0]) * ilvl/100 * roll + yRange[0])
         
         if self.zStat != None:
-            self.zValue = (self.zRange[-1] - self.zRange[0]) * ilvl/100 * roll + self.zRange[0]
-            self.zValue = round(self.zValue)
-        
-        # create boni (only for global scope)
-        self.boni = []
-        if self.scope == "global":
-            if self.xType == "additive":
-                self.boni.append(Bonus.Bonus(self.xStat, self.xValue, 0)) 
-            elif self.xType == "multiplicative":
-                self.boni.append(Bonus.Bonus(self.xStat, 0 , self.xValue))
+            zRange = self.zRange
+            self.zValue = round((zRange[-1] - zRange[0]) * ilvl/100 * roll + zRange[0])
+                  
+        # description is templated lazily on first access
+        self._description = None
+        
+    @property
+    def boni(self):
+        # boni are derived from the rolled values (only for global scope)
+        boni = []
+        if self.scope != "global":
+            return boni
+        
+        if self.xType == "additive":
+            boni.append(Bonus.Bonus(self.xStat, self.xValue, 0)) 
+        elif self.xType == "multiplicative":
+            boni.append(Bonus.Bonus(self.xStat, 0 , self.xValue))
             
-        if self.scope == "global" and self.yStat != None:
+        if self.yStat != None:
             if self.yType == "additive":
-                self.boni.append(Bonus.Bonus(self.yStat, self.yValue, 0)) 
+                boni.append(Bonus.Bonus(self.yStat, self.yValue, 0)) 
             elif self.yType == "multiplicative":
-                self.boni.append(Bonus.Bonus(self.yStat, 0 , self.yValue))
+                boni.append(Bonus.Bonus(self.yStat, 0 , self.yValue))
                 
-        if self.scope == "global" and self.zStat != None:
+        if self.zStat != None:
             if self.zType == "additive":
-                self.boni.append(Bonus.Bonus(self.zStat, self.zValue, 0)) 
+                boni.append(Bonus.Bonus(self.zStat, self.zValue, 0)) 
             elif self.zType == "multiplicative":
-                self.boni.append(Bonus.Bonus(self.zStat, 0 , self.zValue))
-                  
-        # create description
-        self.description = self.ph_description.replace("xValue", str(self.xValue))
-        if self.yStat is not None:
-            self.description = self.description.replace("yValue", str(self.yValue))
-        if self.zStat is not None:
-            self.description = self.description.replace("zValue", str(self.zValue))
+                boni.append(Bonus.Bonus(self.zStat, 0 , self.zValue))
+        return boni
+        
+    @property
+    def description(self):
+        if self._description is None:
+            description = self.ph_description.replace("xValue", str(self.xValue))
+            if self.yStat is not None:
+                description = description.replace("yValue", str(self.yValue))
+            if self.zStat is not None:
+                description = description.replace("zValue", str(self.zValue))
+            self._description = description
+        return self._description
         
     def has_tag(self, tag):
         if tag in self.tags:
@@ -1,49 +1,26 @@
-import json
-import os
 import random
 from core import bonus as Bonus
+from core.items.catalog import BASE_FILE_NAME, Catalog, TemplateField, get_catalog, load_json
 
 # --- Configuration ---
-JSON_FILE_NAME = "Bases.json"
-
-def _candidate_paths(filename: str):
-    here = os.path.dirname(__file__)              # .../core/items
-    root = os.path.dirname(os.path.dirname(here)) # project root
-    return [
-        os.path.join(root, "data", filename),   # preferred location
-        os.path.join(root, filename),            # legacy root location
-    ]
+JSON_FILE_NAME = BASE_FILE_NAME
 
 class BaseTypeLoader():
     
-    def __init__(self):
+    def __init__(self, catalog: Catalog | None = None, rng=None):
         
-        self.baseTypeList = self.load_data()
+        # shared, read-only base definitions (loaded once per process)
+        self.catalog = catalog if catalog is not None else get_catalog()
+        # private random stream (random.Random or numpy Generator)
+        self.rng = rng if rng is not None else random.Random()
+        self.baseTypeList = self.catalog.bases
     
     def load_data(self, file_path: str | None = None):
         """
-        Loads affix data from a JSON file and returns it as a Python dictionary.
+        Loads base data from a JSON file and returns it as a Python dictionary.
+        Prefer get_catalog()/reload_catalog(), which parse the file only once.
         """
-        # Determine candidate paths (data/ then root/) unless an explicit path is provided
-        paths = [file_path] if file_path else _candidate_paths(JSON_FILE_NAME)
-        last_err = None
-        for p in paths:
-            try:
-                if p and os.path.exists(p):
-                    with open(p, 'r') as f:
-                        data = json.load(f)
-                    return data
-            except json.JSONDecodeError as e:
-                last_err = e
-                break
-            except OSError as e:
-                last_err = e
-                continue
-        if last_err:
-            print(f"Error loading base data: {last_err}")
-        else:
-            print(f"Warning: Base data file not found in any expected location: {paths}")
-        return {}
+        return load_json(JSON_FILE_NAME, file_path, label="base")
         
     def get_baseType_by_name(self, baseTypeList, name):
         """
@@ -55,65 +32,52 @@ class BaseTypeLoader():
         """
         Retrieves a list of all basetypes with the given ilvl.
         """
-        baseTypes = []
-        
-        # prevent low level bases to drop (20 levels below ilvl)
-        max_lvl = ilvl
-        min_lvl = max(ilvl - 25, 0)
-        
-        # Apply restrictions
-        for baseType in self.baseTypeList.values():
-            if max_lvl >= baseType.get("lvl_req"):
-                if min_lvl <= baseType.get("lvl_req"):
-                    if baseType.get("name") not in exclude:
-                        if gearSlot == "random":
-                            baseTypes.append(baseType)
-                        if baseType.get("slot") == gearSlot:
-                            baseTypes.append(baseType)
-    
-        return baseTypes
+        # prevent low level bases to drop (25 levels below ilvl)
+        return list(self.catalog.base_table(ilvl, exclude, gearSlot).items)
 
     def create_random_baseType(self, ilvl, exclude=[], gearSlot="random"):
 
-        js_baseTypes = self.get_allowed_baseTypes(ilvl, exclude, gearSlot)
-        weights = [bt['weight'] for bt in js_baseTypes]
-        
-        js_baseType = random.choices(js_baseTypes, weights=weights)[0]
+        js_baseType = self.catalog.base_table(ilvl, exclude, gearSlot).pick(self.rng)
         
         baseType = BaseType(js_baseType, ilvl)
         return baseType
         
     
 class BaseType():
+    __slots__ = ("template", "ilvl", "total_additives", "total_multiplier",
+                 "xValue", "yValue", "zValue", "_description")
+
+    # from json (shared catalog entry, never copied per base)
+    slot = TemplateField("slot") # string
+    name = TemplateField("name") 
+    vagueName = TemplateField("vagueName") 
+    
+    tags = TemplateField("tags") # string array
+    
+    lvl_req = TemplateField("lvl_req") # int
+    str_req = TemplateField("str_req") # int
+    int_req = TemplateField("int_req") # int
+    dex_req = TemplateField("dex_req") # int
+    
+    description0 = TemplateField("description", None) # string
+    
+    xStat = TemplateField("xStat", None) # string
+    xType = TemplateField("xType", None) # int
+    xValue0 = TemplateField("xValue", None) # int
+
+    yStat = TemplateField("yStat", None) # string
+    yType = TemplateField("yType", None) # int
+    yValue0 = TemplateField("yValue", None) # int
+   
+    zStat = TemplateField("zStat", None) # string
+    zType = TemplateField("zType", None) # int
+    zValue0 = TemplateField("zValue", None) # int    
+
     def __init__(self, json_baseType, ilvl):
         
-        # from json
-        self.slot = json_baseType["slot"] # string
-        self.name = json_baseType["name"] 
-        self.vagueName = json_baseType["vagueName"] 
-        
-        self.tags = json_baseType["tags"] # string array
-        
-        self.lvl_req = json_baseType["lvl_req"] # int
-        self.str_req = json_baseType["str_req"] # int
-        self.int_req = json_baseType["int_req"] # int
-        self.dex_req = json_baseType["dex_req"] # int
-        
-        self.description0 = json_baseType.get("description") # string
-        
-        self.xStat = json_baseType.get("xStat") # string
-        self.xType = json_baseType.get("xType") # int
-        self.xValue0 = json_baseType.get("xValue") # int
+        self.template = json_baseType
         self.xValue = self.xValue0 # int
-
-        self.yStat = json_baseType.get("yStat") # string
-        self.yType = json_baseType.get("yType") # int
-        self.yValue0 = json_baseType.get("yValue") # int
         self.yValue = self.yValue0 # int
-       
-        self.zStat = json_baseType.get("zStat") # string
-        self.zType = json_baseType.get("zType") # int
-        self.zValue0 = json_baseType.get("zValue") # int    
         self.zValue = self.zValue0 # int    
         
         # intrinsic
@@ -130,37 +94,49 @@ class BaseType():
         
         # apply modifications from affix modifiers
         self.xValue = round((self.xValue0 + self.total_additives) * (1 + self.total_multiplier/100))
-        self.description = str(self.description0).replace("xValue", str(self.xValue))
         
         if self.yValue != None:
             self.yValue = round((self.yValue0 + self.total_additives) * (1 + self.total_multiplier/100))
-            self.description = str(self.description).replace("yValue", str(self.yValue))
         
         if self.zValue != None:
             self.zValue = round((self.zValue0 + self.total_additives) * (1 + self.total_multiplier/100))
-            self.description = str(self.description).replace("zValue", str(self.zValue)) 
         
-        # create boni
-        self.boni = []
+        # description is re-templated lazily on next access
+        self._description = None
+        
+    @property
+    def boni(self):
+        # boni are derived from the current (modified) values
+        boni = []
 
         if self.xType == "additive":
-            self.boni.append(Bonus.Bonus(self.xStat, self.xValue, 0)) 
+            boni.append(Bonus.Bonus(self.xStat, self.xValue, 0)) 
         elif self.xType == "multiplicative":
-            self.boni.append(Bonus.Bonus(self.xStat, 0 , self.xValue))
+            boni.append(Bonus.Bonus(self.xStat, 0 , self.xValue))
             
         if self.yStat != None:
             if self.yType == "additive":
-                self.boni.append(Bonus.Bonus(self.yStat, self.yValue, 0)) 
+                boni.append(Bonus.Bonus(self.yStat, self.yValue, 0)) 
             elif self.yType == "multiplicative":
-                self.boni.append(Bonus.Bonus(self.yStat, 0 , self.yValue))
+                boni.append(Bonus.Bonus(self.yStat, 0 , self.yValue))
                 
         if self.zStat != None:
             if self.zType == "additive":
-                self.boni.append(Bonus.Bonus(self.zStat, self.zValue, 0)) 
+                boni.append(Bonus.Bonus(self.zStat, self.zValue, 0)) 
             elif self.xType == "multiplicative":
-                self.boni.append(Bonus.Bonus(self.zStat, 0 , self.zValue))   
-
-        
+                boni.append(Bonus.Bonus(self.zStat, 0 , self.zValue))   
+        return boni
+        
+    @property
+    def description(self):
+        if self._description is None:
+            description = str(self.description0).replace("xValue", str(self.xValue))
+            if self.yValue != None:
+                description = description.replace("yValue", str(self.yValue))
+            if self.zValue != None:
+                description = description.replace("zValue", str(self.zValue))
+            self._description = description
+        return self._description
         
     def modify_base_values(self, add_mod = 0, multi_mod = 0):
         
@@ -0,0 +1,255 @@
+import json
+import logging
+import os
+import random
+import threading
+from bisect import bisect, bisect_left, bisect_right
+from collections.abc import MutableSequence, Sequence
+from itertools import accumulate
+from types import MappingProxyType
+
+from systems.equipment import normalize_slot
+
+logger = logging.getLogger(__name__)
+
+# --- Configuration ---
+AFFIX_FILE_NAME = "Affixes.json"
+BASE_FILE_NAME = "Bases.json"
+# compiled form of both files (python -m core.items.compiled)
+COMPILED_FILE_NAME = "catalog.bin"
+
+# bases more than this many levels below ilvl no longer drop
+BASE_LVL_WINDOW = 25
+# upper bound for cached (slot, ilvl window, exclusions) base tables
+BASE_TABLE_CACHE_SIZE = 4096
+
+
+def _candidate_paths(filename: str):
+    here = os.path.dirname(__file__)              # .../core/items
+    root = os.path.dirname(os.path.dirname(here)) # project root
+    return [
+        os.path.join(root, "data", filename),   # preferred location
+        os.path.join(root, filename),            # legacy root location
+    ]
+
+
+def find_data_file(filename: str, file_path: str | None = None) -> str | None:
+    """Returns the path load_json would read, or None if there is none."""
+    paths = [file_path] if file_path else _candidate_paths(filename)
+    for p in paths:
+        if p and os.path.exists(p):
+            return p
+    return None
+
+
+def load_json(filename: str, file_path: str | None = None, label: str = "data"):
+    """
+    Loads a JSON data file and returns it as a Python dictionary.
+    Probes data/ then the project root unless an explicit path is provided.
+    """
+    paths = [file_path] if file_path else _candidate_paths(filename)
+    last_err = None
+    for p in paths:
+        try:
+            if p and os.path.exists(p):
+                with open(p, 'r') as f:
+                    data = json.load(f)
+                return data
+        except json.JSONDecodeError as e:
+            last_err = e
+            break
+        except OSError as e:
+            last_err = e
+            continue
+    if last_err:
+        logger.error("Error loading %s data: %s", label, last_err)
+    else:
+        logger.warning("%s data file not found in any expected location: %s", label.capitalize(), paths)
+    return {}
+
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class WeightedTable():
+    """
+    Immutable weighted population with prebuilt cumulative weights.
+    pick() is a single bisect and draws exactly like random.choices.
+    """
+    __slots__ = ("items", "cum_weights", "total")
+
+    def __init__(self, items, weights):
+        # immutable sequences (tuples, lazy catalog views) are kept as they are
+        self.items = items if isinstance(items, Sequence) and not isinstance(items, MutableSequence) else tuple(items)
+        self.cum_weights = tuple(accumulate(weights))
+        self.total = (self.cum_weights[-1] + 0.0) if self.cum_weights else 0.0
+
+    def __len__(self):
+        return len(self.items)
+
+    def pick(self, rng=random):
+        return self.items[bisect(self.cum_weights, rng.random() * self.total, 0, len(self.items) - 1)]
+
+
+_EMPTY_TABLE = WeightedTable((), ())
+
+_REQUIRED = object()
+
+
+class TemplateField():
+    """
+    Read-only attribute served from an object's shared catalog entry
+    (obj.template), so per-instance storage holds only rolled state.
+    """
+    __slots__ = ("key", "default")
+
+    def __init__(self, key, default=_REQUIRED):
+        self.key = key
+        self.default = default
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        if self.default is _REQUIRED:
+            return obj.template[self.key]
+        return obj.template.get(self.key, self.default)
+
+
+class Catalog():
+    """
+    Read-only view of the affix and base definitions.
+
+    A catalog is built once and shared by reference between loaders and
+    generators; nothing in it may be mutated. Use reload_catalog() to pick up
+    changed data files.
+    """
+
+    def __init__(self, affixes, bases):
+        self.affixes = _freeze(dict(affixes))
+        self.bases = _freeze(dict(bases))
+        # entries by catalog position; the indexes below hold positions
+        self._affix_entries = tuple(self.affixes.values())
+        self._base_entries = tuple(self.bases.values())
+        self._affix_index = self._build_affix_index()
+        self._base_index = self._build_base_index()
+        self._base_names = frozenset(b.get("name") for b in self._base_entries)
+        self._affix_tables = {}
+        self._base_tables = {}
+
+    @classmethod
+    def from_files(cls, affix_path: str | None = None, base_path: str | None = None):
+        affixes = load_json(AFFIX_FILE_NAME, affix_path, label="affix")
+        bases = load_json(BASE_FILE_NAME, base_path, label="base")
+        return cls(affixes, bases)
+
+    def _build_affix_index(self):
+        # (affixType, slot) -> affix positions in catalog order, as listed in their "slots"
+        grouped = {}
+        for pos, affix in enumerate(self._affix_entries):
+            for slot in dict.fromkeys(affix.get("slots") or ()):
+                grouped.setdefault((affix.get("type"), slot), []).append(pos)
+        return {key: tuple(positions) for key, positions in grouped.items()}
+
+    def _build_base_index(self):
+        # slot -> (sorted lvl_reqs, base positions sorted by (lvl_req, position));
+        # the "random" partition holds every base
+        partitions = {"random": []}
+        for pos, base in enumerate(self._base_entries):
+            partitions["random"].append((base.get("lvl_req"), pos))
+            partitions.setdefault(base.get("slot"), []).append((base.get("lvl_req"), pos))
+        index = {}
+        for slot, rows in partitions.items():
+            rows.sort()
+            index[slot] = (tuple(row[0] for row in rows), tuple(row[1] for row in rows))
+        return index
+
+    def base_table(self, ilvl, exclude=(), gearSlot="random") -> WeightedTable:
+        """
+        Returns the weighted bases that may drop at ilvl for a slot:
+        lvl_req within [ilvl - BASE_LVL_WINDOW, ilvl] and name not excluded.
+        Tables are cached per (slot, level window, exclusions).
+        """
+        partition = self._base_index.get(gearSlot)
+        if partition is None:
+            return _EMPTY_TABLE
+        lvls, positions = partition
+        lo = bisect_left(lvls, max(ilvl - BASE_LVL_WINDOW, 0))
+        hi = bisect_right(lvls, ilvl)
+        excluded = frozenset(n for n in exclude if n in self._base_names) if exclude else frozenset()
+        key = (gearSlot, lo, hi, excluded)
+        table = self._base_tables.get(key)
+        if table is None:
+            # keep catalog order inside the window so draws match a linear scan
+            window = sorted(positions[lo:hi])
+            if excluded:
+                window = [pos for pos in window if self._base_entries[pos].get("name") not in excluded]
+            table = self._table(self._base_entries, window)
+            if len(self._base_tables) >= BASE_TABLE_CACHE_SIZE:
+                self._base_tables.clear()
+            self._base_tables[key] = table
+        return table
+
+    def _table(self, entries, positions) -> WeightedTable:
+        items = tuple(entries[pos] for pos in positions)
+        return WeightedTable(items, [e["weight"] for e in items]) if items else _EMPTY_TABLE
+
+    def affix_table(self, affixType, gear_slot) -> WeightedTable:
+        """
+        Returns the weighted affixes of a type that may roll on a gear slot.
+        Slots without their own entries resolve through SLOT_ALIASES.
+        """
+        table = self._affix_tables.get((affixType, gear_slot))
+        if table is None:
+            positions = self._affix_index.get((affixType, gear_slot))
+            if positions is None:
+                positions = self._affix_index.get((affixType, normalize_slot(gear_slot)), ())
+            table = self._table(self._affix_entries, positions)
+            self._affix_tables[(affixType, gear_slot)] = table
+        return table
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> Catalog:
+    """
+    Returns the process-wide catalog, loading it from disk on first use.
+    """
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = load_catalog()
+    return _catalog
+
+
+def load_catalog(affix_path: str | None = None, base_path: str | None = None) -> Catalog:
+    """
+    Opens data/catalog.bin when it is up to date with the JSON files and
+    falls back to parsing the JSON otherwise. The JSON stays the source of truth.
+    """
+    from core.items.compiled import open_compiled
+
+    catalog = open_compiled(affix_path=affix_path, base_path=base_path)
+    if catalog is None:
+        catalog = Catalog.from_files(affix_path, base_path)
+    return catalog
+
+
+def reload_catalog(affix_path: str | None = None, base_path: str | None = None) -> Catalog:
+    """
+    Re-reads the data files and replaces the process-wide catalog.
+    Loaders created earlier keep the catalog they were given.
+    """
+    global _catalog
+    catalog = load_catalog(affix_path, base_path)
+    with _catalog_lock:
+        _catalog = catalog
+    return catalog
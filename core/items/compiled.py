@@ -0,0 +1,470 @@
+"""Compiled (binary) form of the affix and base catalogs.
+
+    python -m core.items.compiled            # writes data/catalog.bin
+    python -m core.items.compiled --check    # reports whether it is up to date
+
+The JSON files stay the source of truth; the compiled file records their
+size, mtime and SHA-256 and is ignored once they change. Layout (all
+little-endian):
+
+    header      magic, format version, source fingerprints, section table
+    strings     interned string table: count, offsets[count + 1], UTF-8 blob
+    affix rows  fixed width: name, type (string ids), weight, entry offset
+    base rows   fixed width: name, slot (string ids), lvl_req, weight, entry offset
+    entries     tagged encoding of each JSON entry, strings as string ids
+    affix index (type, slot) -> affix positions in catalog order
+    base index  slot -> (lvl_req, base position), sorted
+
+The file is opened with mmap (read-only, so every process shares the same
+pages) and entries are decoded the first time they are used.
+"""
+import argparse
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from functools import cached_property
+from types import MappingProxyType
+
+from core.items.catalog import (
+    AFFIX_FILE_NAME,
+    BASE_FILE_NAME,
+    COMPILED_FILE_NAME,
+    Catalog,
+    WeightedTable,
+    _EMPTY_TABLE,
+    _candidate_paths,
+    find_data_file,
+)
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"GCAT"
+FORMAT_VERSION = 1
+
+_SOURCE = struct.Struct("<Qq32s")  # size, mtime_ns, sha256
+_SECTION = struct.Struct("<QQ")    # offset, length
+_SECTIONS = ("strings", "affix_rows", "base_rows", "entries", "affix_index", "base_index")
+_HEADER = struct.Struct("<4sI" + _SOURCE.format[1:] * 2 + _SECTION.format[1:] * len(_SECTIONS))
+
+_U32 = struct.Struct("<I")
+_AFFIX_ROW = struct.Struct("<IIdQ")   # name, type, weight, entry offset
+_BASE_ROW = struct.Struct("<IIidQ")   # name, slot, lvl_req, weight, entry offset
+_AFFIX_KEY = struct.Struct("<IIII")   # type, slot, start, count
+_BASE_PART = struct.Struct("<III")    # slot, start, count
+_BASE_POS = struct.Struct("<iI")      # lvl_req, position
+
+# the "random" base partition has no slot string
+_NO_STRING = 0xFFFFFFFF
+
+# entry value tags
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT = range(8)
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+
+def default_path() -> str:
+    return _candidate_paths(COMPILED_FILE_NAME)[0]
+
+
+def _fingerprint(path):
+    st = os.stat(path)
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).digest()
+    return st.st_size, st.st_mtime_ns, digest
+
+
+def _is_current(path, size, mtime_ns, digest) -> bool:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if st.st_size != size:
+        return False
+    if st.st_mtime_ns == mtime_ns:
+        return True
+    # touched but possibly unchanged
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest() == digest
+
+
+# --- Writing ---
+
+class _Encoder():
+    def __init__(self):
+        self.strings = {}
+        self.entries = bytearray()
+
+    def intern(self, text) -> int:
+        return self.strings.setdefault(text, len(self.strings))
+
+    def add_entry(self, value) -> int:
+        offset = len(self.entries)
+        self._encode(value)
+        return offset
+
+    def _encode(self, value):
+        out = self.entries
+        if value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, int):
+            out.append(_INT)
+            out += _I64.pack(value)
+        elif isinstance(value, float):
+            out.append(_FLOAT)
+            out += _F64.pack(value)
+        elif isinstance(value, str):
+            out.append(_STR)
+            out += _U32.pack(self.intern(value))
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST)
+            out += _U32.pack(len(value))
+            for item in value:
+                self._encode(item)
+        elif isinstance(value, Mapping):
+            out.append(_DICT)
+            out += _U32.pack(len(value))
+            for key, item in value.items():
+                out += _U32.pack(self.intern(key))
+                self._encode(item)
+        else:
+            raise TypeError(f"Cannot compile value of type {type(value).__name__}")
+
+    def string_table(self) -> bytes:
+        blobs = [text.encode("utf-8") for text in self.strings]
+        offsets = [0]
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+        return _U32.pack(len(blobs)) + struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(blobs)
+
+
+def compile_catalog(out_path: str | None = None, affix_path: str | None = None,
+                    base_path: str | None = None) -> str:
+    """Compiles the JSON catalogs into out_path (default data/catalog.bin)."""
+    sources = [find_data_file(AFFIX_FILE_NAME, affix_path), find_data_file(BASE_FILE_NAME, base_path)]
+    if None in sources:
+        raise FileNotFoundError("Affix and base JSON files are required to compile the catalog")
+    # reuse the JSON catalog's own index building, so both forms agree
+    catalog = Catalog.from_files(*sources)
+    enc = _Encoder()
+
+    affix_rows = bytearray(_U32.pack(len(catalog._affix_entries)))
+    for name, affix in catalog.affixes.items():
+        affix_rows += _AFFIX_ROW.pack(enc.intern(name), enc.intern(affix.get("type")),
+                                      affix.get("weight", 0), enc.add_entry(affix))
+
+    base_rows = bytearray(_U32.pack(len(catalog._base_entries)))
+    for name, base in catalog.bases.items():
+        base_rows += _BASE_ROW.pack(enc.intern(name), enc.intern(base.get("slot")), base.get("lvl_req"),
+                                    base.get("weight", 0), enc.add_entry(base))
+
+    keys, ids = bytearray(), bytearray()
+    for (affix_type, slot), positions in catalog._affix_index.items():
+        keys += _AFFIX_KEY.pack(enc.intern(affix_type), enc.intern(slot), len(ids) // 4, len(positions))
+        ids += struct.pack(f"<{len(positions)}I", *positions)
+    affix_index = _U32.pack(len(catalog._affix_index)) + keys + ids
+
+    parts, rows = bytearray(), bytearray()
+    for slot, (lvls, positions) in catalog._base_index.items():
+        sid = _NO_STRING if slot == "random" else enc.intern(slot)
+        parts += _BASE_PART.pack(sid, len(rows) // _BASE_POS.size, len(positions))
+        for lvl, pos in zip(lvls, positions):
+            rows += _BASE_POS.pack(lvl, pos)
+    base_index = _U32.pack(len(catalog._base_index)) + parts + rows
+
+    # the string table goes last: every section above may intern strings
+    sections = {
+        "affix_rows": bytes(affix_rows),
+        "base_rows": bytes(base_rows),
+        "entries": bytes(enc.entries),
+        "affix_index": bytes(affix_index),
+        "base_index": bytes(base_index),
+    }
+    sections["strings"] = enc.string_table()
+
+    table, offset = [], _HEADER.size
+    for name in _SECTIONS:
+        table += [offset, len(sections[name])]
+        offset += len(sections[name])
+    fingerprints = [field for path in sources for field in _fingerprint(path)]
+
+    out_path = out_path or default_path()
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, *fingerprints, *table))
+        for name in _SECTIONS:
+            f.write(sections[name])
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+# --- Reading ---
+
+class _CompiledFile():
+    """mmap of a compiled catalog with lazy string and entry decoding."""
+
+    def __init__(self, buf, sections):
+        self.buf = buf
+        self.sections = sections
+        offset, _ = sections["strings"]
+        (count,) = _U32.unpack_from(buf, offset)
+        self._string_offsets = self.u32_array(offset + 4, count + 1)
+        self._string_base = offset + 4 + 4 * (count + 1)
+        self._strings = [None] * count
+
+    def string(self, sid):
+        text = self._strings[sid]
+        if text is None:
+            start, end = self._string_offsets[sid], self._string_offsets[sid + 1]
+            text = self._strings[sid] = str(self.buf[self._string_base + start:self._string_base + end], "utf-8")
+        return text
+
+    def entry(self, offset):
+        value, _ = self._decode(self.sections["entries"][0] + offset)
+        return value
+
+    def _decode(self, pos):
+        buf = self.buf
+        tag = buf[pos]
+        pos += 1
+        if tag == _STR:
+            return self.string(_U32.unpack_from(buf, pos)[0]), pos + 4
+        if tag == _INT:
+            return _I64.unpack_from(buf, pos)[0], pos + 8
+        if tag == _FLOAT:
+            return _F64.unpack_from(buf, pos)[0], pos + 8
+        if tag == _LIST:
+            (count,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            items = []
+            for _ in range(count):
+                item, pos = self._decode(pos)
+                items.append(item)
+            return tuple(items), pos
+        if tag == _DICT:
+            (count,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            items = {}
+            for _ in range(count):
+                key = self.string(_U32.unpack_from(buf, pos)[0])
+                items[key], pos = self._decode(pos + 4)
+            return MappingProxyType(items), pos
+        if tag == _NONE:
+            return None, pos
+        if tag in (_TRUE, _FALSE):
+            return tag == _TRUE, pos
+        raise ValueError(f"Corrupt catalog entry (tag {tag})")
+
+    def rows(self, section, row):
+        offset, _ = self.sections[section]
+        (count,) = _U32.unpack_from(self.buf, offset)
+        return row.iter_unpack(self.buf[offset + 4:offset + 4 + count * row.size])
+
+    def u32_array(self, offset, count):
+        values = array("I", self.buf[offset:offset + 4 * count])
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values
+
+
+class _LazyEntries():
+    """Sequence of catalog entries decoded (and kept) on first access."""
+    __slots__ = ("_file", "_offsets", "weights", "_cache")
+
+    def __init__(self, compiled_file, offsets, weights):
+        self._file = compiled_file
+        self._offsets = offsets
+        self.weights = weights
+        self._cache = [None] * len(offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, pos):
+        entry = self._cache[pos]
+        if entry is None:
+            entry = self._cache[pos] = self._file.entry(self._offsets[pos])
+        return entry
+
+    def __iter__(self):
+        return (self[pos] for pos in range(len(self)))
+
+
+class _EntryView(Sequence):
+    """Entries at some positions, decoded only when picked."""
+    __slots__ = ("_entries", "_positions")
+
+    def __init__(self, entries, positions):
+        self._entries = entries
+        self._positions = positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return tuple(self._entries[pos] for pos in self._positions[i])
+        return self._entries[self._positions[i]]
+
+
+class _LazyMapping(Mapping):
+    """
+    Read-only name -> entry mapping over _LazyEntries, in catalog order.
+    Names are decoded and indexed on the first lookup by name.
+    """
+
+    def __init__(self, compiled_file, name_ids, entries):
+        self._file = compiled_file
+        self._name_ids = name_ids
+        self._entries = entries
+
+    @cached_property
+    def _positions(self):
+        return {name: pos for pos, name in enumerate(self)}
+
+    def __getitem__(self, name):
+        return self._entries[self._positions[name]]
+
+    def __contains__(self, name):
+        return name in self._positions
+
+    def __iter__(self):
+        return (self._file.string(sid) for sid in self._name_ids)
+
+    def __len__(self):
+        return len(self._name_ids)
+
+
+class CompiledCatalog(Catalog):
+    """Catalog served from a compiled file; see the module docstring."""
+
+    def __init__(self, compiled_file):
+        self._file = compiled_file
+        affix_names, affix_weights, affix_offsets = array("I"), array("d"), []
+        for name, _, weight, offset in compiled_file.rows("affix_rows", _AFFIX_ROW):
+            affix_names.append(name)
+            affix_weights.append(weight)
+            affix_offsets.append(offset)
+        base_names, base_weights, base_offsets = array("I"), array("d"), []
+        for name, _, _, weight, offset in compiled_file.rows("base_rows", _BASE_ROW):
+            base_names.append(name)
+            base_weights.append(weight)
+            base_offsets.append(offset)
+
+        self._affix_entries = _LazyEntries(compiled_file, affix_offsets, affix_weights)
+        self._base_entries = _LazyEntries(compiled_file, base_offsets, base_weights)
+        self.affixes = _LazyMapping(compiled_file, affix_names, self._affix_entries)
+        self.bases = _LazyMapping(compiled_file, base_names, self._base_entries)
+        self._affix_index = self._read_affix_index()
+        self._base_index = self._read_base_index()
+        self._affix_tables = {}
+        self._base_tables = {}
+
+    @cached_property
+    def _base_names(self):
+        # only needed once a caller excludes bases by name
+        return frozenset(self.bases)
+
+    def _table(self, entries, positions) -> WeightedTable:
+        # weights come from the fixed-width rows; entries decode when picked
+        if not len(positions):
+            return _EMPTY_TABLE
+        return WeightedTable(_EntryView(entries, tuple(positions)), [entries.weights[pos] for pos in positions])
+
+    def _read_affix_index(self):
+        buf, (offset, _) = self._file.buf, self._file.sections["affix_index"]
+        (count,) = _U32.unpack_from(buf, offset)
+        ids_offset = offset + 4 + count * _AFFIX_KEY.size
+        index = {}
+        for i in range(count):
+            typ, slot, start, n = _AFFIX_KEY.unpack_from(buf, offset + 4 + i * _AFFIX_KEY.size)
+            index[(self._file.string(typ), self._file.string(slot))] = self._file.u32_array(ids_offset + 4 * start, n)
+        return index
+
+    def _read_base_index(self):
+        buf, (offset, _) = self._file.buf, self._file.sections["base_index"]
+        (count,) = _U32.unpack_from(buf, offset)
+        rows_offset = offset + 4 + count * _BASE_PART.size
+        index = {}
+        for i in range(count):
+            sid, start, n = _BASE_PART.unpack_from(buf, offset + 4 + i * _BASE_PART.size)
+            start = rows_offset + start * _BASE_POS.size
+            lvls, positions = array("i"), array("I")
+            for lvl, pos in _BASE_POS.iter_unpack(buf[start:start + n * _BASE_POS.size]):
+                lvls.append(lvl)
+                positions.append(pos)
+            slot = "random" if sid == _NO_STRING else self._file.string(sid)
+            index[slot] = (lvls, positions)
+        return index
+
+
+def _read_header(buf):
+    if len(buf) < _HEADER.size:
+        raise ValueError("truncated header")
+    fields = _HEADER.unpack_from(buf, 0)
+    magic, version = fields[:2]
+    if magic != MAGIC:
+        raise ValueError("not a compiled catalog")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"format version {version}, expected {FORMAT_VERSION}")
+    sources = [fields[2:5], fields[5:8]]
+    table = fields[8:]
+    sections = {name: (table[2 * i], table[2 * i + 1]) for i, name in enumerate(_SECTIONS)}
+    for offset, length in sections.values():
+        if offset + length > len(buf):
+            raise ValueError("truncated section")
+    return sources, sections
+
+
+def open_compiled(path: str | None = None, affix_path: str | None = None,
+                  base_path: str | None = None) -> CompiledCatalog | None:
+    """
+    Opens a compiled catalog if it exists and matches the JSON files it was
+    built from; returns None otherwise (callers fall back to the JSON).
+    """
+    path = path or default_path()
+    if not os.path.exists(path):
+        return None
+    sources = [find_data_file(AFFIX_FILE_NAME, affix_path), find_data_file(BASE_FILE_NAME, base_path)]
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        recorded, sections = _read_header(buf)
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring compiled catalog %s: %s", path, e)
+        return None
+    for source, fingerprint in zip(sources, recorded):
+        if source is None or not _is_current(source, *fingerprint):
+            logger.info("Compiled catalog %s is stale, loading JSON", path)
+            buf.close()
+            return None
+    return CompiledCatalog(_CompiledFile(buf, sections))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile Affixes.json/Bases.json into a binary catalog")
+    parser.add_argument("--out", default=None, help="Output path (default data/catalog.bin)")
+    parser.add_argument("--affixes", default=None, help="Affix JSON path")
+    parser.add_argument("--bases", default=None, help="Base JSON path")
+    parser.add_argument("--check", action="store_true", help="Only report whether the compiled file is current")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        current = open_compiled(args.out, args.affixes, args.bases) is not None
+        print("up to date" if current else "stale or missing")
+        return 0 if current else 1
+    path = compile_catalog(args.out, args.affixes, args.bases)
+    print(f"Wrote {path} ({os.path.getsize(path)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
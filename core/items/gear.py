@@ -1,4 +1,9 @@
 class Gear:
+    __slots__ = ("_name", "rarity", "base", "exceptional", "prefixes", "suffixes",
+                 "lvl_req_red", "req_red", "slot", "lvl_req", "str_req", "int_req", "dex_req",
+                 "_name_description", "_affix_descriptions", "_stat_req_string",
+                 "_base_descriptions", "_full_description", "_dict")
+
     def __init__(self,
                  name: str | None = None,
                  rarity: str = "normal",
@@ -7,18 +12,27 @@ class Gear:
                  prefixes = None,
                  suffixes = None):
 
-        # Inputs (do not mutate caller-provided lists)
-        self.name = name  # optional override; if None, derive from components
+        # Inputs (copied to tuples; caller-provided lists are never mutated)
+        self._name = name  # optional override; if None, derive from components
         self.rarity = rarity
         self.base = base
         self.exceptional = exceptional
-        self.prefixes = prefixes or []
-        self.suffixes = suffixes or []
+        self.prefixes = tuple(prefixes or ())
+        self.suffixes = tuple(suffixes or ())
 
         # Initialize derived/defaulted fields
         self.lvl_req_red = 0
         self.req_red = 0
 
+        # Display strings are built lazily on first access (see properties below);
+        # drops that are filtered or vendored never pay for them.
+        self._name_description = None
+        self._affix_descriptions = None
+        self._stat_req_string = None
+        self._base_descriptions = None
+        self._full_description = None
+        self._dict = None
+
         # Base-derived fields (set after base is present)
         # If base is None, keep sensible defaults to avoid attribute errors
         if self.base is not None:
@@ -39,11 +53,50 @@ class Gear:
             # keep original call to base.modify_base_values to preserve behavior
             self.base.modify_base_values(multi_mod=50)
 
-        # Orchestrate building the gear
-        self.construct_name()
+        # Orchestrate building the gear (numeric stats only; boni are derived on access)
         self.apply_affixes()
         self.determine_reqs()
-        self.build_tooltip()
+
+    @property
+    def name(self):
+        # Explicit override, else the first line of the constructed name
+        if self._name:
+            return self._name
+        return self.name_description.split("\n")[0]
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+
+    @property
+    def name_description(self):
+        if self._name_description is None:
+            self.construct_name()
+        return self._name_description
+
+    @property
+    def affix_descriptions(self):
+        if self._affix_descriptions is None:
+            self.build_affix_descriptions()
+        return self._affix_descriptions
+
+    @property
+    def stat_req_string(self):
+        if self._stat_req_string is None:
+            self.build_req_string()
+        return self._stat_req_string
+
+    @property
+    def base_descriptions(self):
+        if self._base_descriptions is None:
+            self.apply_description()
+        return self._base_descriptions
+
+    @property
+    def full_description(self):
+        if self._full_description is None:
+            self.build_tooltip()
+        return self._full_description
 
     def construct_name(self):
         # Derive the display name based on base and affixes if no explicit name provided.
@@ -51,46 +104,40 @@ class Gear:
         vague_name = (getattr(self.base, "vagueName", base_name) if self.base else base_name)
 
         # If explicit name is provided, honor it for Magic/Rare primary line
-        explicit = bool(self.name)
+        explicit = bool(self._name)
 
         if self.rarity == "Normal":
             derived = base_name
             if self.exceptional:
                 derived = "Exceptional " + base_name
-            self.name_description = derived
+            self._name_description = derived
 
         elif self.rarity == "Magic":
             # Magic naming: "<Prefix.clearName> <Base.name> <Suffix.clearName>" if available
             pref = self.prefixes[0].clearName + " " if (self.prefixes and getattr(self.prefixes[0], "clearName", "")) else ""
             suf = (" " + self.suffixes[0].clearName) if (self.suffixes and getattr(self.suffixes[0], "clearName", "")) else ""
             derived = f"{pref}{base_name}{suf}".strip()
-            primary = self.name if explicit else derived
+            primary = self._name if explicit else derived
             if self.exceptional:
-                self.name_description = primary + "\nExceptional " + base_name
+                self._name_description = primary + "\nExceptional " + base_name
             else:
-                self.name_description = primary
+                self._name_description = primary
 
         elif self.rarity == "Rare":
             # Rare naming: choose one affix.name and combine with base.vagueName
             affix_names = [getattr(a, "name", "") for a in (self.prefixes + self.suffixes) if getattr(a, "name", "")]
-            chosen = affix_names[0] if affix_names else (self.name if explicit else "Nameless")
-            primary = self.name if explicit else f"{chosen} {vague_name}".strip()
+            chosen = affix_names[0] if affix_names else (self._name if explicit else "Nameless")
+            primary = self._name if explicit else f"{chosen} {vague_name}".strip()
             if self.exceptional:
-                self.name_description = primary + "\nExceptional " + base_name
+                self._name_description = primary + "\nExceptional " + base_name
             else:
-                self.name_description = primary + "\n" + base_name
+                self._name_description = primary + "\n" + base_name
 
         else:
             # Fallback for unexpected rarity values
-            self.name_description = self.name if explicit else base_name
+            self._name_description = self._name if explicit else base_name
 
-        # Ensure public `name` is a usable primary display string
-        # If no explicit name was provided, default to the first line of the constructed name.
-        if not self.name and hasattr(self, "name_description") and self.name_description:
-            self.name = self.name_description.split("\n")[0]
-
-    def apply_affixes(self):
-        # --------------------------- descriptions --------------------------
+    def build_affix_descriptions(self):
         affix_lines = []
         for prefix in self.prefixes:
             affix_lines.append("(P) " + getattr(prefix, "description", str(prefix)))
@@ -98,10 +145,11 @@ class Gear:
             affix_lines.append("(S) " + getattr(suffix, "description", str(suffix)))
 
         if affix_lines:
-            self.affix_descriptions = "\n------------------------------------------\n" + "\n".join(affix_lines)
+            self._affix_descriptions = "\n------------------------------------------\n" + "\n".join(affix_lines)
         else:
-            self.affix_descriptions = ""
+            self._affix_descriptions = ""
 
+    def apply_affixes(self):
         # -------------------------- apply effects --------------------------
         # Separate base boni (from base after local modifiers) and global affix boni
         # 1) Apply local affixes to base implicits
@@ -122,50 +170,61 @@ class Gear:
             if getattr(aff, "xStat", None) == "lvl_red":
                 self.lvl_req_red += getattr(aff, "xValue", 0)
 
-        # 3) Aggregate boni
-        self.base_boni = []
-        self.affix_boni = []
-
-        if self.base is not None:
-            self.base_boni.extend(getattr(self.base, "boni", []))
-
+    @property
+    def base_boni(self):
+        # boni from base after local modifiers
+        if self.base is None:
+            return []
+        return list(getattr(self.base, "boni", []))
+
+    @property
+    def affix_boni(self):
+        # global affix boni
+        boni = []
         for aff in (self.prefixes + self.suffixes):
             if getattr(aff, "scope", "global") == "global":
-                self.affix_boni.extend(getattr(aff, "boni", []))
+                boni.extend(getattr(aff, "boni", []))
+        return boni
 
+    @property
+    def boni(self):
         # Public combined view
-        self.boni = self.base_boni + self.affix_boni
+        return self.base_boni + self.affix_boni
 
     def determine_reqs(self):
         # stat requirements (apply req_red collected from suffixes)
-        req_parts = []
         if self.base is not None and getattr(self.base, "str_req", 0) != 0:
             self.str_req = round(self.base.str_req * (1 - self.req_red / 100))
-            req_parts.append(f"Req. Str.: {self.str_req}")
         if self.base is not None and getattr(self.base, "int_req", 0) != 0:
             self.int_req = round(self.base.int_req * (1 - self.req_red / 100))
-            req_parts.append(f"Req. Int.: {self.int_req}")
         if self.base is not None and getattr(self.base, "dex_req", 0) != 0:
             self.dex_req = round(self.base.dex_req * (1 - self.req_red / 100))
-            req_parts.append(f"Req. Dex.: {self.dex_req}")
-
-        self.stat_req_string = ("\n" + " ".join(req_parts)) if req_parts else ""
 
         # level requirement (apply lvl_req_red)
         # Use self.lvl_req (initialized from base earlier) and reduce
         self.lvl_req = max(self.lvl_req - self.lvl_req_red, 1)
 
+    def build_req_string(self):
+        req_parts = []
+        if self.base is not None and getattr(self.base, "str_req", 0) != 0:
+            req_parts.append(f"Req. Str.: {self.str_req}")
+        if self.base is not None and getattr(self.base, "int_req", 0) != 0:
+            req_parts.append(f"Req. Int.: {self.int_req}")
+        if self.base is not None and getattr(self.base, "dex_req", 0) != 0:
+            req_parts.append(f"Req. Dex.: {self.dex_req}")
+
+        self._stat_req_string = ("\n" + " ".join(req_parts)) if req_parts else ""
+
     def apply_description(self):
         # Keep this small helper (same behavior as original)
         if self.base is None or getattr(self.base, "description", "") == "":
-            self.base_descriptions = ""
+            self._base_descriptions = ""
         else:
-            self.base_descriptions = "\n------------------------------------------\n" + self.base.description
+            self._base_descriptions = "\n------------------------------------------\n" + self.base.description
 
     def build_tooltip(self):
         # Build the base description string used by __str__
         # This keeps the separators and layout exactly like your original example.
-        self.apply_description()  # ensure base_descriptions is set
         # Compose final block for printing avoiding empty lines
         body = []
         body.append(self.name_description)
@@ -177,7 +236,7 @@ class Gear:
             body.append(self.affix_descriptions.strip("\n"))
 
         content = "\n".join(body)
-        self.full_description = (
+        self._full_description = (
             f"\n==========================================\n" +
             content +
             f"\n==========================================\n"
@@ -188,22 +247,24 @@ class Gear:
         return self.full_description
 
     def to_dict(self):
-        # Structured representation for testing/UI
-        return {
-            "name": self.name_description.split("\n")[0],
-            "rarity": self.rarity,
-            "slot": self.slot,
-            "ilvl_req": self.lvl_req,
-            "reqs": {
-                "str": getattr(self, "str_req", 0),
-                "int": getattr(self, "int_req", 0),
-                "dex": getattr(self, "dex_req", 0),
-            },
-            "base_description": self.base_descriptions,
-            "affix_descriptions": self.affix_descriptions,
-            "base_boni": [str(b) for b in getattr(self, "base_boni", [])],
-            "affix_boni": [str(b) for b in getattr(self, "affix_boni", [])],
-        }
+        # Structured representation for testing/UI (built once, then cached)
+        if self._dict is None:
+            self._dict = {
+                "name": self.name_description.split("\n")[0],
+                "rarity": self.rarity,
+                "slot": self.slot,
+                "ilvl_req": self.lvl_req,
+                "reqs": {
+                    "str": getattr(self, "str_req", 0),
+                    "int": getattr(self, "int_req", 0),
+                    "dex": getattr(self, "dex_req", 0),
+                },
+                "base_description": self.base_descriptions,
+                "affix_descriptions": self.affix_descriptions,
+                "base_boni": [str(b) for b in getattr(self, "base_boni", [])],
+                "affix_boni": [str(b) for b in getattr(self, "affix_boni", [])],
+            }
+        return self._dict
 
     def __str__(self):
         # Concise one-liner for logging/debugging
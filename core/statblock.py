@@ -0,0 +1,121 @@
+"""Vectorized stat engine for many characters at once (requires NumPy).
+
+A StatBlock holds one row per character and one column per stat id, using
+the same definitions, routes and formula as core.stats.StatRegistry:
+
+    total = clamp(round((base + additives) * (1 + multiplier / 100), decimals))
+
+Bonus batches are scatter-added and all totals are recomputed in one pass.
+np.round may differ from round() in the last decimal for values that sit on
+an exact binary tie; everything else matches the per-character path.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from core.character import ITEM_ONLY_STATS, STAT_DEFINITIONS, STAT_ROUTES
+from core.stats import StatRegistry
+
+
+class StatBlock:
+    def __init__(self, count: int, definitions=STAT_DEFINITIONS, routes=STAT_ROUTES, ignored=ITEM_ONLY_STATS):
+        # the registry only serves as the schema: column order, routes, limits
+        self.schema = StatRegistry(definitions, routes=routes, ignored=ignored)
+        self.sids = tuple(self.schema.sids)
+        columns = len(self.sids)
+        self.decimals = np.frombuffer(self.schema.decimals, dtype=np.int8).astype(np.int64)
+        self.minimum = np.frombuffer(self.schema.minimum, dtype=np.float64).copy()
+        self.maximum = np.frombuffer(self.schema.maximum, dtype=np.float64).copy()
+
+        self.base = np.tile(np.frombuffer(self.schema.base, dtype=np.float64), (count, 1))
+        self.additives = np.zeros((count, columns))
+        self.multiplier = np.zeros((count, columns))
+        self.total = np.zeros((count, columns))
+        self.recompute()
+
+    @classmethod
+    def from_characters(cls, characters):
+        """Copies the current stat state of each character into one block row."""
+        block = cls(len(characters))
+        for row, character in enumerate(characters):
+            registry = character.stat_registry
+            for name in ("base", "additives", "multiplier"):
+                getattr(block, name)[row] = np.frombuffer(getattr(registry, name), dtype=np.float64)
+        block.recompute()
+        return block
+
+    def __len__(self):
+        return self.base.shape[0]
+
+    def column(self, sid) -> int:
+        """Column index of a stat id (raises UnknownStatError)."""
+        return self.schema.index_of(sid)
+
+    def totals(self, sid) -> np.ndarray:
+        return self.total[:, self.column(sid)]
+
+    def _expand(self, rows, sids, values):
+        # map bonus ids to columns; routed ids (e.g. all_res) fan out to several
+        rows = np.asarray(rows, dtype=np.int64)
+        values = [np.broadcast_to(np.asarray(v, dtype=np.float64), rows.shape) for v in values]
+        if isinstance(sids, str):
+            targets = np.array(self.schema.resolve(sids), dtype=np.int64)
+            cols = np.tile(targets, len(rows))
+            return np.repeat(rows, len(targets)), cols, [np.repeat(v, len(targets)) for v in values]
+        uniq = {}
+        codes = np.fromiter((uniq.setdefault(s, len(uniq)) for s in sids), dtype=np.int64, count=len(rows))
+        targets = [self.schema.resolve(s) for s in uniq]
+        fan_out = np.array([len(t) for t in targets], dtype=np.int64)[codes]
+        flat = np.array([c for t in targets for c in t], dtype=np.int64)
+        starts = np.concatenate(([0], np.cumsum([len(t) for t in targets])))[:-1].astype(np.int64)
+
+        rep = np.repeat(np.arange(len(rows)), fan_out)
+        offset = np.arange(len(rep)) - np.repeat(np.cumsum(fan_out) - fan_out, fan_out)
+        cols = flat[starts[codes[rep]] + offset] if len(rep) else np.zeros(0, dtype=np.int64)
+        return rows[rep], cols, [v[rep] for v in values]
+
+    def apply_bonuses(self, rows, sids, add_bonus=0, multi_bonus=0, recompute=True):
+        """
+        Scatter-adds a batch of boni: bonus k goes to character rows[k] and
+        stat id sids[k] (a single sid applies to every row). Repeated
+        (row, stat) pairs accumulate.
+        """
+        rows, cols, (add, multi) = self._expand(rows, sids, (add_bonus, multi_bonus))
+        if len(rows) * 8 < self.base.size:
+            # small batch: touch only the addressed cells
+            np.add.at(self.additives, (rows, cols), add)
+            np.add.at(self.multiplier, (rows, cols), multi)
+        else:
+            # large batch: one dense scatter-add on the flattened (row, column) index
+            cells = rows * self.base.shape[1] + cols
+            size = self.base.size
+            self.additives += np.bincount(cells, weights=add, minlength=size).reshape(self.base.shape)
+            self.multiplier += np.bincount(cells, weights=multi, minlength=size).reshape(self.base.shape)
+        if recompute:
+            self.recompute()
+
+    def apply_bonus_objects(self, row, boni, recompute=True):
+        """Convenience wrapper for a list of core.bonus.Bonus on one row."""
+        boni = list(boni)
+        self.apply_bonuses([row] * len(boni), [b.sid for b in boni],
+                           [b.add_bonus for b in boni], [b.multi_bonus for b in boni], recompute)
+
+    def recompute(self):
+        total = (self.base + self.additives) * (1 + self.multiplier / 100)
+        # rounding, grouped by precision
+        for decimals in np.unique(self.decimals):
+            cols = self.decimals == decimals
+            total[:, cols] = np.round(total[:, cols], int(decimals))
+        # validity checks
+        np.minimum(total, self.maximum, out=total)
+        np.maximum(total, self.minimum, out=total)
+        self.total = total
+        return total
+
+    def write_back(self, characters):
+        """Copies each row's values into the matching character's registry."""
+        for row, character in enumerate(characters):
+            registry = character.stat_registry
+            for name in ("base", "additives", "multiplier", "total"):
+                np.frombuffer(getattr(registry, name), dtype=np.float64)[:] = getattr(self, name)[row]
+            registry.dirty[:] = bytes(len(registry.dirty))
@@ -1,35 +1,188 @@
+from array import array
+
+
+class UnknownStatError(KeyError):
+    """Raised when a stat id is neither registered nor routed."""
+
+
+class StatRegistry:
+    """
+    Stat storage for one character: every stat lives at a fixed index and
+    its base/additives/multiplier/total values sit in contiguous arrays.
+    Lookups by sid or name are a single dict access. Bonus changes only mark
+    their stat dirty; the total is recomputed when it is next read.
+
+    routes maps bonus ids that are not stats themselves onto stats
+    (e.g. "all_res" -> every resistance); ids in ignored are accepted and
+    dropped (effects that live on the item, like requirement reducers).
+    """
+    __slots__ = ("names", "sids", "index", "by_name", "routes", "ignored",
+                 "base", "additives", "multiplier", "total", "decimals", "minimum", "maximum", "dirty")
+
+    def __init__(self, definitions=(), routes=None, ignored=()):
+        self.names = []
+        self.sids = []
+        self.index = {}
+        self.by_name = {}
+        self.routes = dict(routes or {})
+        self.ignored = frozenset(ignored)
+        self.base = array("d")
+        self.additives = array("d")
+        self.multiplier = array("d")
+        self.total = array("d")
+        self.decimals = array("b")
+        self.minimum = array("d")
+        self.maximum = array("d")
+        self.dirty = bytearray()
+        for definition in definitions:
+            self.register(*definition)
+
+    def __len__(self):
+        return len(self.sids)
+
+    def register(self, name="NoName", sid="NoID", base=0, decimals=2, minimum=-1e6, maximum=1e6) -> int:
+        if sid in self.index:
+            raise ValueError(f"Duplicate stat id '{sid}'")
+        i = len(self.sids)
+        self.names.append(name)
+        self.sids.append(sid)
+        self.index[sid] = i
+        self.by_name.setdefault(name, i)
+        self.base.append(base)
+        self.additives.append(0)
+        self.multiplier.append(0)
+        self.total.append(0)
+        self.decimals.append(decimals)
+        self.minimum.append(minimum)
+        self.maximum.append(maximum)
+        self.dirty.append(0)
+        self.update_total(i)
+        return i
+
+    def index_of(self, sid) -> int:
+        try:
+            return self.index[sid]
+        except KeyError:
+            raise UnknownStatError(sid) from None
+
+    def index_of_name(self, name) -> int:
+        try:
+            return self.by_name[name]
+        except KeyError:
+            raise UnknownStatError(name) from None
+
+    def resolve(self, sid):
+        """Returns the stat indices a bonus id applies to (empty if ignored)."""
+        i = self.index.get(sid)
+        if i is not None:
+            return (i,)
+        if sid in self.routes:
+            return tuple(self.index_of(target) for target in self.routes[sid])
+        if sid in self.ignored:
+            return ()
+        raise UnknownStatError(sid)
+
+    def add_bonus(self, i, add_bonus=0, multi_bonus=0):
+        self.additives[i] += add_bonus
+        self.multiplier[i] += multi_bonus
+        self.dirty[i] = 1
+
+    def apply(self, sid, add_bonus=0, multi_bonus=0):
+        for i in self.resolve(sid):
+            self.add_bonus(i, add_bonus, multi_bonus)
+
+    def update_total(self, i):
+        total = (self.base[i] + self.additives[i]) * (1 + self.multiplier[i] / 100)
+
+        # rounding
+        total = round(total, self.decimals[i])
+
+        # validity checks
+        if total > self.maximum[i]:
+            total = self.maximum[i]
+        if total < self.minimum[i]:
+            total = self.minimum[i]
+        self.total[i] = total
+        self.dirty[i] = 0
+
+    def get_total(self, i):
+        if self.dirty[i]:
+            self.update_total(i)
+        return self.total[i]
+
+    def update_all(self):
+        for i, flag in enumerate(self.dirty):
+            if flag:
+                self.update_total(i)
+
+    def stat(self, i) -> "Stat":
+        return Stat.view(self, i)
+
+
 class Stat:
+    """
+    View of one entry in a StatRegistry. Constructing a Stat directly gives it
+    a private single-entry registry.
+    """
+    __slots__ = ("registry", "i")
+
     def __init__(self, name="NoName", sid="NoID", base=0, decimals=2, minimum=-1e6, maximum=1e6):
-        self.name= name
-        self.sid = sid
-        self.base = base
-        self.decimals = decimals
-        self.minimum = minimum
-        self.maximum = maximum
-        self.add_boni = []
-        self.multi_boni = []
-        self.total = 0
-        self.total_additives = 0
-        self.total_multiplier = 0
-        self.update_total()
-        
+        self.registry = StatRegistry()
+        self.i = self.registry.register(name, sid, base, decimals, minimum, maximum)
+
+    @classmethod
+    def view(cls, registry, i):
+        stat = cls.__new__(cls)
+        stat.registry = registry
+        stat.i = i
+        return stat
+
+    @property
+    def name(self):
+        return self.registry.names[self.i]
+
+    @property
+    def sid(self):
+        return self.registry.sids[self.i]
+
+    @property
+    def base(self):
+        return self.registry.base[self.i]
+
+    @base.setter
+    def base(self, value):
+        self.registry.base[self.i] = value
+        self.registry.dirty[self.i] = 1
+
+    @property
+    def decimals(self):
+        return self.registry.decimals[self.i]
+
+    @property
+    def minimum(self):
+        return self.registry.minimum[self.i]
+
+    @property
+    def maximum(self):
+        return self.registry.maximum[self.i]
+
+    @property
+    def total_additives(self):
+        return self.registry.additives[self.i]
+
+    @property
+    def total_multiplier(self):
+        return self.registry.multiplier[self.i]
+
+    @property
+    def total(self):
+        return self.registry.get_total(self.i)
+
     def add_bonus(self, add_bonus=0, multi_bonus=0):
-        self.total_additives += add_bonus
-        self.total_multiplier += multi_bonus
-        self.update_total()
-        
+        self.registry.add_bonus(self.i, add_bonus, multi_bonus)
+
     def update_total(self):
-        self.total = (self.base + self.total_additives)*(1 + self.total_multiplier / 100)
-        
-        # rounding
-        self.total = round(self.total, self.decimals)
-        
-        # validity checks
-        if self.total > self.maximum:
-            self.total = self. maximum
-        if self.total < self.minimum:
-            self.total = self.minimum
-        
-    
+        self.registry.update_total(self.i)
+
     def __str__(self):
         return f"{self.name} | {self.sid} | base: {self.base} | added: {self.total_additives} | multi: {self.total_multiplier} | total: {self.total}"
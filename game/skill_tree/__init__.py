@@ -4,6 +4,8 @@ Modules:
 - types: core enums and dataclasses
 - rng: deterministic RNG helpers
 - generator: cluster and node generation
+- region: vectorized generation of whole regions (NumPy)
 - grid: world state and discovery
+- prefetch: background generation of clusters behind unassigned connectors
 - ui.pygame_ui: minimal Pygame viewer
 """
@@ -9,16 +9,20 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from game.skill_tree.grid import GridState
+from game.skill_tree.prefetch import ClusterPrefetcher
 from game.skill_tree.ui.pygame_ui import SkillTreeViewer
 
 
 def main():
     world_seed = 1337
-    grid = GridState(world_seed=world_seed)
+    grid = GridState(world_seed=world_seed, prefetcher=ClusterPrefetcher(world_seed))
     grid.ensure_origin()
 
     viewer = SkillTreeViewer(grid)
-    viewer.run()
+    try:
+        viewer.run()
+    finally:
+        grid.prefetcher.shutdown()
 
 
 if __name__ == "__main__":
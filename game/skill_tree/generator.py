@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 
-from .rng import cluster_rng, weighted_choice, choose_n_unique
-from .types import Affinity, Cluster, Connector, Node, NodeType
+from .rng import WeightedTable, cluster_rng, choose_n_unique
+from .types import ASSIGNED_BIT, CENTER_BIT, Affinity, Cluster, Connector, NodeType, pack_node
+
+# in-cluster index of the origin's center node (ix = iy = 2)
+CENTER_INDEX = 2 * 5 + 2
 
 
 # Hard-coded distributions
@@ -48,27 +51,30 @@ def _affinity_weights_for_bias(bias: Optional[Affinity]) -> Dict[Affinity, float
     return base
 
 
+# Sampling tables, built once from the maps above (rebuild after editing them)
+AFFINITY_TABLES: Dict[Optional[Affinity], WeightedTable[Affinity]] = {
+    bias: WeightedTable.from_mapping(_affinity_weights_for_bias(bias)) for bias in [None, *Affinity]
+}
+NODETYPE_TABLES: Dict[Affinity, WeightedTable[NodeType]] = {
+    affinity: WeightedTable.from_mapping(weights) for affinity, weights in NODETYPE_WEIGHTS_BY_AFFINITY.items()
+}
+SIDE_TABLE: WeightedTable[str] = WeightedTable(['N', 'S', 'E', 'W'], [1, 1, 1, 1])
+
+
 def _pick_affinity(rng, bias: Optional[Affinity]) -> Affinity:
-    weights_map = _affinity_weights_for_bias(bias)
-    items = list(weights_map.keys())
-    weights = [weights_map[a] for a in items]
-    return weighted_choice(rng, items, weights)
+    return AFFINITY_TABLES[bias].pick(rng)
 
 
 def _pick_node_type(rng, affinity: Affinity) -> NodeType:
-    m = NODETYPE_WEIGHTS_BY_AFFINITY[affinity]
-    items = list(m.keys())
-    weights = [m[k] for k in items]
-    return weighted_choice(rng, items, weights)
+    return NODETYPE_TABLES[affinity].pick(rng)
 
 
 def _make_connectors(rng, bias: Optional[Affinity]) -> List[Connector]:
     # Choose 2-6 connectors placed along edges, ensure some variety
-    sides = ['N', 'S', 'E', 'W']
     count = int(rng.random() * 5) + 2  # 2..6
     connectors: List[Connector] = []
     for _ in range(count):
-        side = weighted_choice(rng, sides, [1, 1, 1, 1])
+        side = SIDE_TABLE.pick(rng)
         edge_index = int(rng.random() * 5)  # 0..4
         # The connector is a real node of the neighbor cluster; its affinity will bias that cluster
         a = _pick_affinity(rng, bias)
@@ -81,18 +87,18 @@ def _make_connectors(rng, bias: Optional[Affinity]) -> List[Connector]:
 
 
 def generate_cluster(world_seed: int, cx: int, cy: int, bias: Optional[Affinity]) -> Cluster:
+    # Draw layout of the cluster stream (see rng.py): node k = iy*5 + ix uses
+    # draws 2k (affinity) and 2k+1 (type), draw 50 the connector count and
+    # connector j draws 51+4j..54+4j (side, edge, affinity, type).
     rng = cluster_rng(world_seed, cx, cy)
-    nodes: List[List[Node]] = []
-    for iy in range(5):
-        row: List[Node] = []
-        for ix in range(5):
-            a = _pick_affinity(rng, bias)
-            nt = _pick_node_type(rng, a)
-            is_center = (cx == 0 and cy == 0 and ix == 2 and iy == 2)
-            # Center node is a neutral grey and marked assigned
-            node = Node(affinity=a, node_type=nt, assigned=is_center, is_center=is_center)
-            row.append(node)
-        nodes.append(row)
+    cells = bytearray(25)
+    for k in range(25):
+        a = _pick_affinity(rng, bias)
+        nt = _pick_node_type(rng, a)
+        cells[k] = pack_node(a, nt)
+    if cx == 0 and cy == 0:
+        # Center node is a neutral grey and marked assigned
+        cells[CENTER_INDEX] |= ASSIGNED_BIT | CENTER_BIT
 
     connectors = _make_connectors(rng, bias)
-    return Cluster(cx=cx, cy=cy, bias=bias, nodes=nodes, connectors=connectors)
+    return Cluster(cx=cx, cy=cy, bias=bias, cells=cells, connectors=connectors)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple
 
 from .generator import generate_cluster
 from .types import Affinity, Cluster, Connector
 
+if TYPE_CHECKING:
+    from .prefetch import ClusterPrefetcher
 
 Coord = Tuple[int, int]
 
@@ -14,6 +16,8 @@ Coord = Tuple[int, int]
 class GridState:
     world_seed: int
     clusters: Dict[Coord, Cluster] = field(default_factory=dict)
+    # optional background generator (same world_seed); only a speed-up
+    prefetcher: Optional["ClusterPrefetcher"] = field(default=None, repr=False, compare=False)
 
     def ensure_origin(self) -> None:
         if (0, 0) not in self.clusters:
@@ -28,7 +32,10 @@ class GridState:
         ncx, ncy = connector.neighbor(src_cluster.cx, src_cluster.cy)
         if (ncx, ncy) not in self.clusters:
             # New cluster inherits bias from connector affinity
-            self.clusters[(ncx, ncy)] = generate_cluster(self.world_seed, ncx, ncy, bias=connector.affinity)
+            self.clusters[(ncx, ncy)] = self._generate(ncx, ncy, connector.affinity)
+            if self.prefetcher is not None:
+                # the same coordinates staged under other biases are now unreachable
+                self.prefetcher.discard_revealed(self)
         neighbor = self.clusters[(ncx, ncy)]
         # Map connector onto neighbor border node and mark assigned
         if connector.direction == 'N':
@@ -46,7 +53,24 @@ class GridState:
         node.assigned = True
 
         connector.assigned = True
+        src_cluster.touch()
         return neighbor
 
+    def _generate(self, cx: int, cy: int, bias: Optional[Affinity]) -> Cluster:
+        if self.prefetcher is not None and self.prefetcher.world_seed == self.world_seed:
+            cluster = self.prefetcher.take(cx, cy, bias)
+            if cluster is not None:
+                return cluster
+        return generate_cluster(self.world_seed, cx, cy, bias=bias)
+
     def visible_clusters(self):
         return list(self.clusters.values())
+
+    def clusters_in_range(self, x0: int, y0: int, x1: int, y1: int) -> Iterator[Cluster]:
+        """Revealed clusters with x0 <= cx <= x1 and y0 <= cy <= y1 (inclusive)."""
+        clusters = self.clusters
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(clusters):
+            # range larger than the world: filtering is cheaper than probing
+            return (c for (cx, cy), c in list(clusters.items()) if x0 <= cx <= x1 and y0 <= cy <= y1)
+        return (c for c in (clusters.get((cx, cy)) for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1))
+                if c is not None)
@@ -0,0 +1,77 @@
+"""Speculative background generation of clusters about to be revealed.
+
+A revealed cluster is a pure function of (world_seed, cx, cy, bias), and
+the bias comes from the connector that reveals it. The prefetcher generates
+the targets of unassigned connectors on a worker pool and stages them under
+((cx, cy), bias). GridState.reveal_neighbor_from_connector takes a staged
+cluster when one matches, and otherwise generates as before, so prefetching
+never changes what a world contains, only when the work happens.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from .generator import generate_cluster
+from .types import Affinity, Cluster
+
+if TYPE_CHECKING:
+    from .grid import GridState
+
+StageKey = Tuple[Tuple[int, int], Optional[Affinity]]
+
+
+class ClusterPrefetcher:
+    def __init__(self, world_seed: int, max_workers: int = 2, max_staged: int = 256):
+        self.world_seed = world_seed
+        self.max_staged = max_staged
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cluster-prefetch")
+        # oldest first; only touched from the thread that owns the GridState
+        self._staged: "OrderedDict[StageKey, Future]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._staged)
+
+    def request(self, cx: int, cy: int, bias: Optional[Affinity]) -> None:
+        """Queues generation of (cx, cy) under `bias` unless already staged."""
+        key = ((cx, cy), bias)
+        if key in self._staged:
+            self._staged.move_to_end(key)
+            return
+        self._staged[key] = self._executor.submit(generate_cluster, self.world_seed, cx, cy, bias)
+        while len(self._staged) > self.max_staged:
+            _, future = self._staged.popitem(last=False)
+            future.cancel()
+
+    def take(self, cx: int, cy: int, bias: Optional[Affinity]) -> Optional[Cluster]:
+        """
+        Removes and returns the staged cluster for (cx, cy, bias). A job
+        still running is waited for; one not started yet is cancelled and
+        None returned, so the caller generates it without queueing.
+        """
+        future = self._staged.pop(((cx, cy), bias), None)
+        if future is None or future.cancel():
+            return None
+        return future.result()
+
+    def prefetch_around(self, grid: "GridState", x0: int, y0: int, x1: int, y1: int) -> None:
+        """Requests every unrevealed cluster reachable through an unassigned connector in the range."""
+        for cluster in grid.clusters_in_range(x0, y0, x1, y1):
+            for connector in cluster.connectors:
+                if connector.assigned:
+                    continue
+                ncx, ncy = connector.neighbor(cluster.cx, cluster.cy)
+                if (ncx, ncy) not in grid.clusters:
+                    self.request(ncx, ncy, connector.affinity)
+
+    def discard_revealed(self, grid: "GridState") -> None:
+        """Drops staged clusters whose coordinates were revealed meanwhile."""
+        for key in [key for key in self._staged if key[0] in grid.clusters]:
+            self._staged.pop(key).cancel()
+
+    def shutdown(self) -> None:
+        for future in self._staged.values():
+            future.cancel()
+        self._staged.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
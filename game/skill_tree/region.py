@@ -0,0 +1,191 @@
+"""Vectorized generation of whole rectangles of clusters (requires NumPy).
+
+generate_region evaluates the counter-based streams of every cluster in a
+rectangle at once (uint64 SplitMix64, wrapping exactly like the scalar code)
+and applies the generator's cumulative tables with array lookups. It follows
+the draw layout documented in generator.generate_cluster, so each cluster
+equals what generate_cluster returns for the same seed, coordinates and bias.
+Cluster objects are only built on request.
+
+Codes: affinities and node types are stored as their Enum values
+(Affinity 1..6, NodeType 1..4); a bias code of 0 means neutral.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from .generator import AFFINITY_TABLES, CENTER_INDEX, NODETYPE_TABLES, SIDE_TABLE
+from .rng import _GAMMA, _MASK64
+from .rng import _mix64 as _mix64_scalar
+from .types import ASSIGNED_BIT, CENTER_BIT, TYPE_SHIFT, Affinity, Cluster, Connector, NodeType
+
+MAX_CONNECTORS = 6
+DRAWS_PER_CLUSTER = 51 + 4 * MAX_CONNECTORS
+SIDES = SIDE_TABLE.items
+
+BiasSpec = Union[None, Affinity, Mapping[Tuple[int, int], Optional[Affinity]]]
+
+
+def _mix64(z: np.ndarray) -> np.ndarray:
+    # same finalizer as rng._mix64; uint64 arithmetic wraps modulo 2**64
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _cluster_keys(world_seed: int, cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+    # vectorized rng.cluster_seed
+    seed_key = np.uint64(_mix64_scalar((world_seed + _GAMMA) & _MASK64))
+    gamma = np.uint64(_GAMMA)
+    key = _mix64((seed_key ^ cx.astype(np.int64).astype(np.uint64)) + gamma)
+    return _mix64((key ^ cy.astype(np.int64).astype(np.uint64)) + gamma)
+
+
+def _draws(keys: np.ndarray, count: int) -> np.ndarray:
+    # (clusters, count) matrix of rng.draw(key, index)
+    steps = np.arange(1, count + 1, dtype=np.uint64) * np.uint64(_GAMMA)
+    z = _mix64(keys[:, None] + steps[None, :])
+    return (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+class _Tables:
+    """Stack of rng.WeightedTable rows, indexed by a code, for array picks."""
+
+    def __init__(self, tables, size, code):
+        width = max(len(t.items) for t in tables.values())
+        self.cum = np.full((size, width), np.inf)
+        self.total = np.ones(size)
+        self.last = np.zeros(size, dtype=np.int64)
+        self.codes = np.zeros((size, width), dtype=np.uint8)
+        for key, table in tables.items():
+            row = code(key)
+            self.cum[row, :len(table.items)] = table.cum_weights
+            self.total[row] = table.total
+            self.last[row] = len(table.items) - 1
+            self.codes[row, :len(table.items)] = [item.value for item in table.items]
+
+    def pick(self, u: np.ndarray, row: np.ndarray) -> np.ndarray:
+        # WeightedTable.pick: first cumulative weight >= u * total, clamped
+        r = u * self.total[row]
+        i = np.minimum((self.cum[row] < r[..., None]).sum(axis=-1), self.last[row])
+        return self.codes[row, i]
+
+
+_AFFINITY = _Tables(AFFINITY_TABLES, len(Affinity) + 1, lambda bias: 0 if bias is None else bias.value)
+_NODETYPE = _Tables(NODETYPE_TABLES, len(Affinity) + 1, lambda affinity: affinity.value)
+_SIDE_CUM = np.array(SIDE_TABLE.cum_weights)
+
+
+@dataclass
+class Region:
+    """
+    Clusters cx in [x0, x1] and cy in [y0, y1] (inclusive), as arrays indexed
+    [cy - y0, cx - x0]. Node arrays add [iy, ix]; connector arrays add the
+    connector slot j (the j-th rolled connector, -1 where not kept).
+    """
+    world_seed: int
+    x0: int
+    y0: int
+    x1: int
+    y1: int
+    bias: np.ndarray                # (h, w) uint8, 0 = neutral
+    affinity: np.ndarray            # (h, w, 5, 5) uint8
+    node_type: np.ndarray           # (h, w, 5, 5) uint8
+    connector_side: np.ndarray      # (h, w, 6) int8 index into SIDES, -1 if unused/duplicate
+    connector_edge: np.ndarray      # (h, w, 6) int8
+    connector_affinity: np.ndarray  # (h, w, 6) uint8
+    connector_type: np.ndarray      # (h, w, 6) uint8
+    connector_mask: np.ndarray      # (h, w) uint32, bit side*5 + edge per kept connector
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.bias.shape
+
+    def __len__(self):
+        return self.bias.size
+
+    def cluster(self, cx: int, cy: int) -> Cluster:
+        """Materializes one cluster of the region."""
+        if not (self.x0 <= cx <= self.x1 and self.y0 <= cy <= self.y1):
+            raise KeyError((cx, cy))
+        y, x = cy - self.y0, cx - self.x0
+        cells = bytearray((self.affinity[y, x] | (self.node_type[y, x] << TYPE_SHIFT)).astype(np.uint8).tobytes())
+        if cx == 0 and cy == 0:
+            cells[CENTER_INDEX] |= ASSIGNED_BIT | CENTER_BIT
+        connectors = [
+            Connector(direction=SIDES[side], edge_index=int(self.connector_edge[y, x, j]),
+                      affinity=Affinity(int(self.connector_affinity[y, x, j])),
+                      node_type=NodeType(int(self.connector_type[y, x, j])), assigned=False)
+            for j, side in enumerate(self.connector_side[y, x].tolist()) if side >= 0
+        ]
+        bias = int(self.bias[y, x])
+        return Cluster(cx=cx, cy=cy, bias=Affinity(bias) if bias else None, cells=cells, connectors=connectors)
+
+    def clusters(self) -> Iterator[Cluster]:
+        for cy in range(self.y0, self.y1 + 1):
+            for cx in range(self.x0, self.x1 + 1):
+                yield self.cluster(cx, cy)
+
+
+def _bias_codes(bias: BiasSpec, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    if bias is None or isinstance(bias, Affinity):
+        return np.full(xs.shape, 0 if bias is None else bias.value, dtype=np.uint8)
+    codes = np.zeros(xs.shape, dtype=np.uint8)
+    for (cx, cy), b in bias.items():
+        if b is not None and xs[0, 0] <= cx <= xs[0, -1] and ys[0, 0] <= cy <= ys[-1, 0]:
+            codes[cy - ys[0, 0], cx - xs[0, 0]] = b.value
+    return codes
+
+
+def generate_region(world_seed: int, x0: int, y0: int, x1: int, y1: int, bias: BiasSpec = None) -> Region:
+    """
+    Generates every cluster with x0 <= cx <= x1 and y0 <= cy <= y1.
+    `bias` is one affinity (or None) for all clusters, or a mapping
+    (cx, cy) -> affinity for per-cluster biases (missing = neutral).
+    """
+    if x1 < x0 or y1 < y0:
+        raise ValueError("empty region")
+    ys, xs = np.mgrid[y0:y1 + 1, x0:x1 + 1]
+    h, w = xs.shape
+    n = h * w
+    bias_codes = _bias_codes(bias, xs, ys)
+    bias_flat = bias_codes.reshape(n)
+
+    u = _draws(_cluster_keys(world_seed, xs.reshape(n), ys.reshape(n)), DRAWS_PER_CLUSTER)
+
+    # nodes: draws 2k (affinity) and 2k + 1 (type)
+    affinity = _AFFINITY.pick(u[:, 0:50:2], np.repeat(bias_flat[:, None], 25, axis=1))
+    node_type = _NODETYPE.pick(u[:, 1:50:2], affinity)
+
+    # connectors: draw 50 is the count, connector j uses 51 + 4j .. 54 + 4j
+    count = (u[:, 50] * 5).astype(np.int64) + 2
+    cu = u[:, 51:].reshape(n, MAX_CONNECTORS, 4)
+    side = np.minimum(np.searchsorted(_SIDE_CUM, cu[..., 0] * SIDE_TABLE.total, side="left"), len(SIDES) - 1)
+    edge = (cu[..., 1] * 5).astype(np.int64)
+    conn_affinity = _AFFINITY.pick(cu[..., 2], np.repeat(bias_flat[:, None], MAX_CONNECTORS, axis=1))
+    conn_type = _NODETYPE.pick(cu[..., 3], conn_affinity)
+
+    # keep the first connector per (side, edge), among the rolled ones
+    rolled = np.arange(MAX_CONNECTORS)[None, :] < count[:, None]
+    position = side * 5 + edge
+    kept = rolled.copy()
+    mask = np.zeros(n, dtype=np.uint32)
+    for j in range(MAX_CONNECTORS):
+        bit = np.left_shift(np.uint32(1), position[:, j].astype(np.uint32))
+        kept[:, j] &= (mask & bit) == 0
+        mask |= np.where(kept[:, j], bit, np.uint32(0))
+
+    return Region(
+        world_seed=world_seed, x0=x0, y0=y0, x1=x1, y1=y1,
+        bias=bias_codes,
+        affinity=affinity.reshape(h, w, 5, 5),
+        node_type=node_type.reshape(h, w, 5, 5),
+        connector_side=np.where(kept, side, -1).astype(np.int8).reshape(h, w, MAX_CONNECTORS),
+        connector_edge=edge.astype(np.int8).reshape(h, w, MAX_CONNECTORS),
+        connector_affinity=conn_affinity.reshape(h, w, MAX_CONNECTORS),
+        connector_type=conn_type.reshape(h, w, MAX_CONNECTORS),
+        connector_mask=mask.reshape(h, w),
+    )
@@ -1,28 +1,65 @@
 from __future__ import annotations
 
-import hashlib
-import random
-from typing import Iterable, Sequence, Tuple, TypeVar
+from bisect import bisect_left
+from typing import Generic, Mapping, Sequence, TypeVar
 
 T = TypeVar("T")
 
+# Counter-based generator: draw i of a cluster is a pure function of
+# (world_seed, cx, cy, i), built from the SplitMix64 finalizer. Only 64-bit
+# integer arithmetic is involved, so results are identical on every
+# platform and Python version, and no per-cluster state has to be seeded.
 
-def _hash_u64(data: bytes) -> int:
-    # Use sha256 and take first 8 bytes as an integer
-    h = hashlib.sha256(data).digest()
-    return int.from_bytes(h[:8], byteorder="big", signed=False)
+_MASK64 = (1 << 64) - 1
+_GAMMA = 0x9E3779B97F4A7C15  # SplitMix64 increment (golden ratio)
+_TO_UNIT = 1.0 / (1 << 53)
+
+
+def _mix64(z: int) -> int:
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
 
 
 def cluster_seed(world_seed: int, cx: int, cy: int) -> int:
-    payload = world_seed.to_bytes(8, "big", signed=False) + cx.to_bytes(8, "big", signed=True) + cy.to_bytes(8, "big", signed=True)
-    return _hash_u64(payload)
+    """64-bit key of a cluster; negative coordinates wrap as two's complement."""
+    key = _mix64((world_seed + _GAMMA) & _MASK64)
+    key = _mix64(((key ^ (cx & _MASK64)) + _GAMMA) & _MASK64)
+    return _mix64(((key ^ (cy & _MASK64)) + _GAMMA) & _MASK64)
+
+
+def draw(key: int, index: int) -> float:
+    """Draw `index` of the stream `key`, uniform in [0, 1) with 53-bit resolution."""
+    return (_mix64((key + (index + 1) * _GAMMA) & _MASK64) >> 11) * _TO_UNIT
+
+
+def cluster_random(world_seed: int, cx: int, cy: int, index: int) -> float:
+    """Random access to draw `index` of a cluster's stream."""
+    return draw(cluster_seed(world_seed, cx, cy), index)
+
+
+class ClusterRng:
+    """Cursor over a cluster's stream; random() returns consecutive draws."""
+    __slots__ = ("key", "index")
 
+    def __init__(self, key: int, index: int = 0):
+        self.key = key
+        self.index = index
 
-def cluster_rng(world_seed: int, cx: int, cy: int) -> random.Random:
-    return random.Random(cluster_seed(world_seed, cx, cy))
+    def random(self, _mask=_MASK64, _gamma=_GAMMA, _to_unit=_TO_UNIT) -> float:
+        # draw(self.key, self.index), inlined: this is the generator's hot path
+        self.index = index = self.index + 1
+        z = (self.key + index * _gamma) & _mask
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _mask
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _mask
+        return ((z ^ (z >> 31)) >> 11) * _to_unit
 
 
-def weighted_choice(rng: random.Random, items: Sequence[T], weights: Sequence[float]) -> T:
+def cluster_rng(world_seed: int, cx: int, cy: int) -> ClusterRng:
+    return ClusterRng(cluster_seed(world_seed, cx, cy))
+
+
+def weighted_choice(rng, items: Sequence[T], weights: Sequence[float]) -> T:
     assert len(items) == len(weights) and len(items) > 0
     total = sum(weights)
     r = rng.random() * total
@@ -34,6 +71,39 @@ def weighted_choice(rng: random.Random, items: Sequence[T], weights: Sequence[fl
     return items[-1]
 
 
-def choose_n_unique(rng: random.Random, population: Sequence[T], n: int) -> Sequence[T]:
-    n = max(0, min(n, len(population)))
-    return rng.sample(list(population), n)
+def choose_n_unique(rng, population: Sequence[T], n: int) -> Sequence[T]:
+    # partial Fisher-Yates; needs only rng.random()
+    pool = list(population)
+    n = max(0, min(n, len(pool)))
+    for i in range(n):
+        j = i + int(rng.random() * (len(pool) - i))
+        pool[i], pool[j] = pool[j], pool[i]
+    return pool[:n]
+
+
+class WeightedTable(Generic[T]):
+    """
+    Precomputed cumulative weights: pick() is one draw and a bisect.
+    Picks exactly what weighted_choice would for the same draw.
+    """
+    __slots__ = ("items", "cum_weights", "total")
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        assert len(items) == len(weights) and len(items) > 0
+        self.items = tuple(items)
+        cum = []
+        acc = 0.0
+        for w in weights:
+            acc += w
+            cum.append(acc)
+        self.cum_weights = tuple(cum)
+        self.total = sum(weights)
+
+    @classmethod
+    def from_mapping(cls, weights: Mapping[T, float]) -> "WeightedTable[T]":
+        return cls(list(weights.keys()), list(weights.values()))
+
+    def pick(self, rng) -> T:
+        # first cumulative weight >= r, like weighted_choice's `r <= acc`
+        i = bisect_left(self.cum_weights, rng.random() * self.total)
+        return self.items[i] if i < len(self.items) else self.items[-1]
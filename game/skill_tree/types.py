@@ -34,6 +34,8 @@ class GridPos:
 
 @dataclass
 class Node:
+    # Standalone node value; clusters store nodes packed (see Cluster) and
+    # hand out NodeView objects instead.
     affinity: Affinity
     node_type: NodeType
     assigned: bool = False
@@ -42,7 +44,24 @@ class Node:
     data: Dict[str, object] = field(default_factory=dict)
 
 
-@dataclass
+# Packed node cell (one byte): bits 0-2 affinity value, bits 3-5 node type
+# value, bit 6 assigned, bit 7 center.
+AFFINITY_MASK = 0x07
+TYPE_SHIFT = 3
+TYPE_MASK = 0x38
+ASSIGNED_BIT = 0x40
+CENTER_BIT = 0x80
+
+_AFFINITY_BY_CODE = (None, *Affinity)
+_NODETYPE_BY_CODE = (None, *NodeType)
+
+
+def pack_node(affinity: Affinity, node_type: NodeType, assigned: bool = False, is_center: bool = False) -> int:
+    return (affinity.value | (node_type.value << TYPE_SHIFT)
+            | (ASSIGNED_BIT if assigned else 0) | (CENTER_BIT if is_center else 0))
+
+
+@dataclass(slots=True)
 class Connector:
     # Direction to neighbor cluster and the edge index (0..4)
     # dir is one of: 'N','S','E','W'
@@ -64,16 +83,99 @@ class Connector:
         raise ValueError(f"Invalid direction {self.direction}")
 
 
-@dataclass
+class NodeView:
+    """Node of a cluster; reads and writes go to the cluster's packed cells."""
+    __slots__ = ("cluster", "index")
+
+    def __init__(self, cluster: "Cluster", index: int):
+        self.cluster = cluster
+        self.index = index
+
+    def _set(self, clear: int, bits: int) -> None:
+        cells = self.cluster.cells
+        cells[self.index] = (cells[self.index] & ~clear & 0xFF) | bits
+        self.cluster.version += 1
+
+    @property
+    def affinity(self) -> Affinity:
+        return _AFFINITY_BY_CODE[self.cluster.cells[self.index] & AFFINITY_MASK]
+
+    @affinity.setter
+    def affinity(self, value: Affinity) -> None:
+        self._set(AFFINITY_MASK, value.value)
+
+    @property
+    def node_type(self) -> NodeType:
+        return _NODETYPE_BY_CODE[(self.cluster.cells[self.index] & TYPE_MASK) >> TYPE_SHIFT]
+
+    @node_type.setter
+    def node_type(self, value: NodeType) -> None:
+        self._set(TYPE_MASK, value.value << TYPE_SHIFT)
+
+    @property
+    def assigned(self) -> bool:
+        return bool(self.cluster.cells[self.index] & ASSIGNED_BIT)
+
+    @assigned.setter
+    def assigned(self, value: bool) -> None:
+        self._set(ASSIGNED_BIT, ASSIGNED_BIT if value else 0)
+
+    @property
+    def is_center(self) -> bool:
+        return bool(self.cluster.cells[self.index] & CENTER_BIT)
+
+    @property
+    def data(self) -> Dict[str, object]:
+        # payload dicts exist only for nodes that use them
+        payload = self.cluster.payload
+        if payload is None:
+            payload = self.cluster.payload = {}
+        return payload.setdefault(self.index, {})
+
+    def __repr__(self):
+        return (f"NodeView(affinity={self.affinity}, node_type={self.node_type}, "
+                f"assigned={self.assigned}, is_center={self.is_center})")
+
+
+@dataclass(slots=True)
 class Cluster:
     cx: int
     cy: int
     bias: Optional[Affinity]  # None means neutral distribution
-    nodes: List[List[Node]]  # 5x5 [iy][ix]
+    cells: bytearray  # 25 packed nodes, index iy*5 + ix (see pack_node)
     connectors: List[Connector] = field(default_factory=list)
-
-    def get_node(self, ix: int, iy: int) -> Node:
-        return self.nodes[iy][ix]
+    # sparse node payloads: index -> data dict
+    payload: Optional[Dict[int, Dict[str, object]]] = None
+    # bumped on every node change (and by touch()); lets views cache renders
+    version: int = field(default=0, compare=False)
+    # (direction, edge_index) -> connector, built on first connector_at()
+    _edges: Optional[Dict[Tuple[str, int], Connector]] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_nodes(cls, cx: int, cy: int, bias: Optional[Affinity], nodes: List[List[Node]],
+                   connectors: Optional[List[Connector]] = None) -> "Cluster":
+        cells = bytearray(pack_node(n.affinity, n.node_type, n.assigned, n.is_center) for row in nodes for n in row)
+        payload = {iy * 5 + ix: n.data for iy, row in enumerate(nodes) for ix, n in enumerate(row) if n.data}
+        return cls(cx=cx, cy=cy, bias=bias, cells=cells, connectors=list(connectors or []), payload=payload or None)
+
+    def get_node(self, ix: int, iy: int) -> NodeView:
+        return NodeView(self, iy * 5 + ix)
+
+    @property
+    def nodes(self) -> List[List[NodeView]]:
+        # 5x5 [iy][ix] views, for callers that walk all nodes
+        return [[NodeView(self, iy * 5 + ix) for ix in range(5)] for iy in range(5)]
+
+    def connector_at(self, direction: str, edge_index: int) -> Optional[Connector]:
+        edges = self._edges
+        if edges is None:
+            # generation keeps one connector per (direction, edge_index)
+            edges = self._edges = {(c.direction, c.edge_index): c for c in self.connectors}
+        return edges.get((direction, edge_index))
+
+    def touch(self) -> None:
+        """Marks the cluster changed (e.g. after a connector was assigned)."""
+        self.version += 1
 
 
 VisibleKey = Tuple[int, int]  # (cx, cy)
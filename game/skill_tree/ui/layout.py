@@ -0,0 +1,97 @@
+"""World-space layout of the skill grid, shared by rendering and hit-testing.
+
+Clusters tile flush: cluster (cx, cy) covers [cx * cluster_size_px,
+(cx + 1) * cluster_size_px) on x, likewise on y. Node (ix, iy) starts at
+ix * step, iy * step inside its cluster. Connectors sit just outside the
+border, centered on the node column (N/S) or row (E/W) of their edge index.
+
+Hit-tests are pure arithmetic on a world point, so their cost does not
+depend on how many clusters are revealed.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from ..types import Connector
+
+DIRECTIONS = ("N", "S", "E", "W")
+
+
+@dataclass(frozen=True)
+class GridLayout:
+    node_size_px: int = 36
+    gap_px: int = 4
+    connector_offset_px: int = 8  # distance of connectors beyond the node area
+    connector_radius: int = 8
+
+    @property
+    def step(self) -> int:
+        return self.node_size_px + self.gap_px
+
+    @property
+    def cluster_size_px(self) -> int:
+        # no outer padding, so neighboring clusters touch
+        return 5 * self.step - self.gap_px
+
+    @property
+    def connector_hit_radius(self) -> int:
+        return self.connector_radius * 2
+
+    def cluster_origin(self, cx: int, cy: int) -> Tuple[int, int]:
+        return cx * self.cluster_size_px, cy * self.cluster_size_px
+
+    def node_origin(self, cx: int, cy: int, ix: int, iy: int) -> Tuple[int, int]:
+        return cx * self.cluster_size_px + ix * self.step, cy * self.cluster_size_px + iy * self.step
+
+    def _connector_offsets(self, direction: str) -> Tuple[int, bool]:
+        # offset of the connector center across the edge from the cluster
+        # origin, and whether the edge runs horizontally (N/S)
+        if direction in ("N", "W"):
+            return -self.gap_px - self.connector_offset_px, direction == "N"
+        return 5 * self.step + self.connector_offset_px, direction == "S"
+
+    def connector_pos(self, cx: int, cy: int, direction: str, edge_index: int) -> Tuple[int, int]:
+        across, horizontal = self._connector_offsets(direction)
+        along = edge_index * self.step + self.node_size_px // 2
+        base_x, base_y = self.cluster_origin(cx, cy)
+        if horizontal:
+            return base_x + along, base_y + across
+        return base_x + across, base_y + along
+
+    def connector_world_pos(self, cx: int, cy: int, conn: Connector) -> Tuple[int, int]:
+        return self.connector_pos(cx, cy, conn.direction, conn.edge_index)
+
+    def cluster_at(self, wx: float, wy: float) -> Tuple[int, int]:
+        size = self.cluster_size_px
+        return math.floor(wx / size), math.floor(wy / size)
+
+    def node_at(self, wx: float, wy: float) -> Optional[Tuple[int, int, int, int]]:
+        """(cx, cy, ix, iy) of the node under a world point, None over a gap."""
+        size, step = self.cluster_size_px, self.step
+        cx, cy = self.cluster_at(wx, wy)
+        lx, ly = wx - cx * size, wy - cy * size
+        ix, iy = int(lx // step), int(ly // step)
+        if lx - ix * step > self.node_size_px or ly - iy * step > self.node_size_px:
+            return None
+        return cx, cy, ix, iy
+
+    def connector_slots_at(self, wx: float, wy: float):
+        """
+        Yields (distance², cx, cy, direction, edge_index) for every connector
+        position within the hit radius of a world point; at most one per
+        direction, since hit bands are narrower than a cluster.
+        """
+        size, step, radius = self.cluster_size_px, self.step, self.connector_hit_radius
+        for direction in DIRECTIONS:
+            across, horizontal = self._connector_offsets(direction)
+            w_across, w_along = (wy, wx) if horizontal else (wx, wy)
+            c_across = math.floor((w_across - across + radius) / size)
+            c_along = math.floor(w_along / size)
+            edge_index = int((w_along - c_along * size) // step)
+            cx, cy = (c_along, c_across) if horizontal else (c_across, c_along)
+            px, py = self.connector_pos(cx, cy, direction, edge_index)
+            dist2 = (wx - px) ** 2 + (wy - py) ** 2
+            if dist2 <= radius ** 2:
+                yield dist2, cx, cy, direction, edge_index
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import math
 import sys
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import pygame
 
 from ..grid import GridState
-from ..types import Affinity, Cluster, Connector, NodeType
+from ..types import Affinity, Cluster, NodeType
+from .layout import GridLayout
 
 
 AFFINITY_COLORS: Dict[Affinity, Tuple[int, int, int]] = {
@@ -20,6 +22,31 @@ AFFINITY_COLORS: Dict[Affinity, Tuple[int, int, int]] = {
     Affinity.VIOLET: (160, 90, 200),
 }
 
+BACKGROUND_COLOR = (18, 18, 22)
+NEUTRAL_TINT = (70, 70, 78)
+TINT_ALPHA = 45
+CENTER_COLOR = (140, 140, 150)
+EMPTY_COLOR = (180, 180, 190)
+
+# Zoom range, and the level-of-detail tiers below full rendering: under
+# LOD_MINI_ZOOM a cluster is its 5x5 mini-bitmap (one block per node),
+# under LOD_TINT_ZOOM only its bias tint.
+MIN_ZOOM = 0.03
+MAX_ZOOM = 3.0
+LOD_MINI_ZOOM = 0.35
+LOD_TINT_ZOOM = 0.08
+
+
+def _blend(color, alpha, under=BACKGROUND_COLOR):
+    return tuple((c * alpha + u * (255 - alpha)) // 255 for c, u in zip(color, under))
+
+
+# Tints as they look composited over the background, for opaque fills
+FLAT_TINTS: Dict[Optional[Affinity], Tuple[int, int, int]] = {
+    None: _blend(NEUTRAL_TINT, TINT_ALPHA),
+    **{a: _blend(c, TINT_ALPHA) for a, c in AFFINITY_COLORS.items()},
+}
+
 
 @dataclass
 class Camera:
@@ -34,6 +61,59 @@ class Camera:
         return sx / self.zoom + self.x, sy / self.zoom + self.y
 
 
+class ClusterSurfaceCache:
+    """
+    LRU cache of rendered cluster surfaces keyed by ((cx, cy), zoom), capped
+    at max_bytes of pixel data. zoom None holds the zoom-independent
+    mini-bitmap. An entry is valid while it belongs to the
+    same Cluster object at the same Cluster.version, which NodeView setters
+    and Cluster.touch() bump on every node or connector change.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: "OrderedDict[Tuple[Tuple[int, int], Optional[float]], Tuple[Cluster, int, pygame.Surface]]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    # rough per-entry cost besides pixels; dominates for 5x5 mini-bitmaps
+    ENTRY_OVERHEAD = 256
+
+    @classmethod
+    def _size(cls, surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize() + cls.ENTRY_OVERHEAD
+
+    def get(self, cluster: Cluster, zoom: Optional[float]) -> Optional[pygame.Surface]:
+        key = ((cluster.cx, cluster.cy), zoom)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        owner, version, surface = entry
+        if owner is not cluster or version != cluster.version:
+            del self._entries[key]
+            self.bytes -= self._size(surface)
+            return None
+        self._entries.move_to_end(key)
+        return surface
+
+    def put(self, cluster: Cluster, zoom: Optional[float], surface: pygame.Surface) -> None:
+        key = ((cluster.cx, cluster.cy), zoom)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= self._size(old[2])
+        self._entries[key] = (cluster, cluster.version, surface)
+        self.bytes += self._size(surface)
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.bytes -= self._size(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+
 class SkillTreeViewer:
     def __init__(self, grid: GridState, width: int = 1200, height: int = 800):
         self.grid = grid
@@ -44,11 +124,17 @@ class SkillTreeViewer:
         self.dragging = False
         self.last_mouse = (0, 0)
 
-        self.node_size_px = 36
-        self.gap_px = 4
-        # Make clusters touch: remove outer padding and compute size accordingly
-        self.cluster_size_px = 5 * (self.node_size_px + self.gap_px) - self.gap_px
-        self.connector_radius = 8
+        # Positions come from the layout, which hit-testing shares
+        self.layout = GridLayout()
+        self.node_size_px = self.layout.node_size_px
+        self.gap_px = self.layout.gap_px
+        self.cluster_size_px = self.layout.cluster_size_px
+        self.connector_radius = self.layout.connector_radius
+        # Margin around a cluster covering the connectors drawn outside its border
+        self.cluster_pad_px = self.gap_px + self.layout.connector_offset_px + max(self.connector_radius, math.ceil(self.node_size_px * 0.35)) + 2
+        self.surface_cache = ClusterSurfaceCache()
+        # (cluster range, revealed count) of the last prefetch scan
+        self._prefetched_for = None
 
     def run(self):
         pygame.init()
@@ -61,9 +147,10 @@ class SkillTreeViewer:
             dt = clock.tick(60)
             self._handle_events()
 
-            screen.fill((18, 18, 22))
+            screen.fill(BACKGROUND_COLOR)
             self._draw_grid(screen)
             pygame.display.flip()
+            self._prefetch(screen)
 
         pygame.quit()
 
@@ -101,146 +188,198 @@ class SkillTreeViewer:
         # Zoom relative to cursor position to keep it stable
         sx, sy = screen_pos
         wx_before, wy_before = self.camera.screen_to_world(sx, sy)
-        self.camera.zoom = max(0.2, min(3.0, self.camera.zoom * factor))
+        self.camera.zoom = max(MIN_ZOOM, min(MAX_ZOOM, self.camera.zoom * factor))
         wx_after, wy_after = self.camera.screen_to_world(sx, sy)
         self.camera.x += (wx_before - wx_after)
         self.camera.y += (wy_before - wy_after)
 
+    def _visible_cluster_range(self, width: int, height: int) -> Tuple[int, int, int, int]:
+        # Cluster coordinates (x0, y0, x1, y1) overlapping the viewport, padded
+        # by the connectors drawn just outside each cluster's border
+        pad = self.cluster_pad_px
+        wx0, wy0 = self.camera.screen_to_world(0, 0)
+        wx1, wy1 = self.camera.screen_to_world(width, height)
+        size = self.cluster_size_px
+        return (math.floor((wx0 - pad) / size), math.floor((wy0 - pad) / size),
+                math.floor((wx1 + pad) / size), math.floor((wy1 + pad) / size))
+
     def _draw_grid(self, screen):
-        for cluster in self.grid.visible_clusters():
+        # Only clusters under the viewport: cost follows screen area, not world size
+        cluster_range = self._visible_cluster_range(*screen.get_size())
+        if self.camera.zoom < LOD_MINI_ZOOM:
+            self._draw_low_detail(screen, *cluster_range)
+            return
+        for cluster in self.grid.clusters_in_range(*cluster_range):
             self._draw_cluster(screen, cluster)
 
+    def _draw_low_detail(self, screen, x0: int, y0: int, x1: int, y1: int):
+        # Composes the range at k pixels per cluster (5 = mini-bitmaps, 1 =
+        # tint only) and scales it onto the screen with a single blit
+        k = 1 if self.camera.zoom < LOD_TINT_ZOOM else 5
+        region = pygame.Surface(((x1 - x0 + 1) * k, (y1 - y0 + 1) * k))
+        region.fill(BACKGROUND_COLOR)
+        for cluster in self.grid.clusters_in_range(x0, y0, x1, y1):
+            pos = ((cluster.cx - x0) * k, (cluster.cy - y0) * k)
+            if k == 1:
+                region.set_at(pos, FLAT_TINTS[cluster.bias])
+                continue
+            bitmap = self.surface_cache.get(cluster, None)
+            if bitmap is None:
+                bitmap = self._render_mini_bitmap(cluster)
+                self.surface_cache.put(cluster, None, bitmap)
+            region.blit(bitmap, pos)
+        sx0, sy0 = self.camera.world_to_screen(*self.layout.cluster_origin(x0, y0))
+        sx1, sy1 = self.camera.world_to_screen(*self.layout.cluster_origin(x1 + 1, y1 + 1))
+        screen.blit(pygame.transform.scale(region, (sx1 - sx0, sy1 - sy0)), (sx0, sy0))
+
+    def _prefetch(self, screen):
+        # Stage the clusters behind the connectors on screen; rescan only
+        # when the view or the revealed set changed
+        prefetcher = self.grid.prefetcher
+        if prefetcher is None or self.camera.zoom < LOD_MINI_ZOOM:
+            return
+        cluster_range = self._visible_cluster_range(*screen.get_size())
+        scan = (cluster_range, len(self.grid.clusters))
+        if scan != self._prefetched_for:
+            self._prefetched_for = scan
+            prefetcher.prefetch_around(self.grid, *cluster_range)
+
     def _draw_cluster(self, screen, cluster: Cluster):
+        # Blit the cached rendering; re-rasterize only when the cluster changed
+        zoom = round(self.camera.zoom, 3)
+        surf = self.surface_cache.get(cluster, zoom)
+        if surf is None:
+            surf = self._render_cluster(cluster, zoom)
+            self.surface_cache.put(cluster, zoom, surf)
+        pad = self.cluster_pad_px
+        base_x, base_y = self.layout.cluster_origin(cluster.cx, cluster.cy)
+        screen.blit(surf, self.camera.world_to_screen(base_x - pad, base_y - pad))
+
+    def _render_mini_bitmap(self, cluster: Cluster) -> pygame.Surface:
+        # One pixel per node over the flat tint: assigned nodes in full
+        # color, unassigned ones faded halfway into the tint
+        tint = FLAT_TINTS[cluster.bias]
+        bitmap = pygame.Surface((5, 5))
+        for iy in range(5):
+            for ix in range(5):
+                node = cluster.get_node(ix, iy)
+                if node.is_center:
+                    color = CENTER_COLOR
+                elif node.node_type == NodeType.EMPTY:
+                    color = EMPTY_COLOR
+                else:
+                    color = AFFINITY_COLORS[node.affinity]
+                bitmap.set_at((ix, iy), color if node.assigned else _blend(color, 128, tint))
+        return bitmap
+
+    def _render_cluster(self, cluster: Cluster, zoom: float) -> pygame.Surface:
+        # Draws the cluster and its connectors onto a transparent surface that
+        # extends cluster_pad_px beyond the cluster on every side
+        pad = self.cluster_pad_px
         cx, cy = cluster.cx, cluster.cy
-        # Clusters tile flush without extra spacing
-        base_x = cx * (self.cluster_size_px)
-        base_y = cy * (self.cluster_size_px)
+        base_x, base_y = self.layout.cluster_origin(cx, cy)
+        cam = Camera(x=base_x - pad, y=base_y - pad, zoom=zoom)
+        surface = pygame.Surface((math.ceil((self.cluster_size_px + 2 * pad) * zoom),) * 2, pygame.SRCALPHA)
 
-        # Draw cluster boundary
-        top_left = self.camera.world_to_screen(base_x, base_y)
-        size = int((self.cluster_size_px) * self.camera.zoom)
-        pygame.draw.rect(screen, (60, 60, 70), (*top_left, size, size), width=max(1, int(1 * self.camera.zoom)))
+        top_left = cam.world_to_screen(base_x, base_y)
+        size = int((self.cluster_size_px) * cam.zoom)
 
         # Cluster tint background based on bias affinity (low alpha)
-        tint_color = (70, 70, 78) if cluster.bias is None else AFFINITY_COLORS[cluster.bias]
-        alpha = 45
-        surf = pygame.Surface((size, size), pygame.SRCALPHA)
-        surf.fill((*tint_color, alpha))
-        screen.blit(surf, top_left)
+        tint_color = NEUTRAL_TINT if cluster.bias is None else AFFINITY_COLORS[cluster.bias]
+        surface.fill((*tint_color, TINT_ALPHA), (*top_left, size, size))
+
+        # Draw cluster boundary
+        pygame.draw.rect(surface, (60, 60, 70), (*top_left, size, size), width=max(1, int(1 * cam.zoom)))
 
         # Draw 5x5 nodes
         for iy in range(5):
             for ix in range(5):
-                node = cluster.nodes[iy][ix]
-                nx = base_x + ix * (self.node_size_px + self.gap_px)
-                ny = base_y + iy * (self.node_size_px + self.gap_px)
-                sx, sy = self.camera.world_to_screen(nx, ny)
-                size = int(self.node_size_px * self.camera.zoom)
+                node = cluster.get_node(ix, iy)
+                nx, ny = self.layout.node_origin(cx, cy, ix, iy)
+                sx, sy = cam.world_to_screen(nx, ny)
+                size = int(self.node_size_px * cam.zoom)
                 rect = pygame.Rect(sx, sy, size, size)
                 # Determine base color, center is grey; EMPTY uses light grey to indicate no effect
                 if node.is_center:
-                    base_color = (140, 140, 150)
+                    base_color = CENTER_COLOR
                 elif node.node_type == NodeType.EMPTY:
-                    base_color = (180, 180, 190)
+                    base_color = EMPTY_COLOR
                 else:
                     base_color = AFFINITY_COLORS[node.affinity]
                 # Draw shape based on node type; unassigned nodes are hollow, assigned are filled
                 if node.node_type.name == 'SKILL':
                     # Rectangle
                     if node.assigned:
-                        pygame.draw.rect(screen, base_color, rect, border_radius=max(2, int(4 * self.camera.zoom)))
+                        pygame.draw.rect(surface, base_color, rect, border_radius=max(2, int(4 * cam.zoom)))
                     else:
-                        pygame.draw.rect(screen, base_color, rect, width=max(1, int(2 * self.camera.zoom)), border_radius=max(2, int(4 * self.camera.zoom)))
+                        pygame.draw.rect(surface, base_color, rect, width=max(1, int(2 * cam.zoom)), border_radius=max(2, int(4 * cam.zoom)))
                 elif node.node_type.name == 'HABIT':
                     # Triangle (isosceles) pointing up
                     points = [(sx + size // 2, sy), (sx, sy + size), (sx + size, sy + size)]
                     if node.assigned:
-                        pygame.draw.polygon(screen, base_color, points)
+                        pygame.draw.polygon(surface, base_color, points)
                     else:
-                        pygame.draw.polygon(screen, base_color, points, width=max(1, int(2 * self.camera.zoom)))
+                        pygame.draw.polygon(surface, base_color, points, width=max(1, int(2 * cam.zoom)))
                 else:
                     # PASSIVE: Circle
                     center = (sx + size // 2, sy + size // 2)
                     radius = max(2, int((size // 2)))
                     if node.assigned:
-                        pygame.draw.circle(screen, base_color, center, radius)
+                        pygame.draw.circle(surface, base_color, center, radius)
                     else:
-                        pygame.draw.circle(screen, base_color, center, radius, width=max(1, int(2 * self.camera.zoom)))
+                        pygame.draw.circle(surface, base_color, center, radius, width=max(1, int(2 * cam.zoom)))
 
         # Draw connectors along edges (hide when assigned since they became real nodes)
         for c in cluster.connectors:
             if c.assigned:
                 continue
-            cx_world, cy_world = self._connector_world_pos(base_x, base_y, c)
-            sx, sy = self.camera.world_to_screen(cx_world, cy_world)
-            size = int(self.node_size_px * 0.7 * self.camera.zoom)
+            cx_world, cy_world = self.layout.connector_world_pos(cx, cy, c)
+            sx, sy = cam.world_to_screen(cx_world, cy_world)
+            size = int(self.node_size_px * 0.7 * cam.zoom)
             base_color = AFFINITY_COLORS[c.affinity]
             # Render connector using same shapes rules
             if c.node_type == NodeType.SKILL:
                 rect = pygame.Rect(sx - size // 2, sy - size // 2, size, size)
                 if c.assigned:
-                    pygame.draw.rect(screen, base_color, rect, border_radius=max(2, int(4 * self.camera.zoom)))
+                    pygame.draw.rect(surface, base_color, rect, border_radius=max(2, int(4 * cam.zoom)))
                 else:
-                    pygame.draw.rect(screen, base_color, rect, width=max(1, int(2 * self.camera.zoom)), border_radius=max(2, int(4 * self.camera.zoom)))
+                    pygame.draw.rect(surface, base_color, rect, width=max(1, int(2 * cam.zoom)), border_radius=max(2, int(4 * cam.zoom)))
             elif c.node_type == NodeType.HABIT:
                 points = [(sx, sy - size // 2), (sx - size // 2, sy + size // 2), (sx + size // 2, sy + size // 2)]
                 if c.assigned:
-                    pygame.draw.polygon(screen, base_color, points)
+                    pygame.draw.polygon(surface, base_color, points)
                 else:
-                    pygame.draw.polygon(screen, base_color, points, width=max(1, int(2 * self.camera.zoom)))
+                    pygame.draw.polygon(surface, base_color, points, width=max(1, int(2 * cam.zoom)))
             elif c.node_type == NodeType.EMPTY:
-                r = max(2, int(self.connector_radius * self.camera.zoom))
-                pygame.draw.circle(screen, (200, 200, 210), (sx, sy), r, width=max(1, int(2 * self.camera.zoom)))
+                r = max(2, int(self.connector_radius * cam.zoom))
+                pygame.draw.circle(surface, (200, 200, 210), (sx, sy), r, width=max(1, int(2 * cam.zoom)))
             else:
-                r = max(2, int(self.connector_radius * self.camera.zoom))
+                r = max(2, int(self.connector_radius * cam.zoom))
                 if c.assigned:
-                    pygame.draw.circle(screen, base_color, (sx, sy), r)
+                    pygame.draw.circle(surface, base_color, (sx, sy), r)
                 else:
-                    pygame.draw.circle(screen, base_color, (sx, sy), r, width=max(1, int(2 * self.camera.zoom)))
-
-    def _connector_world_pos(self, base_x: int, base_y: int, conn: Connector):
-        # Position circles just outside the 5x5 area
-        step = self.node_size_px + self.gap_px
-        if conn.direction == 'N':
-            x = base_x + conn.edge_index * step + self.node_size_px // 2
-            y = base_y - self.gap_px - 8
-        elif conn.direction == 'S':
-            x = base_x + conn.edge_index * step + self.node_size_px // 2
-            y = base_y + 5 * step + 8
-        elif conn.direction == 'E':
-            x = base_x + 5 * step + 8
-            y = base_y + conn.edge_index * step + self.node_size_px // 2
-        else:  # 'W'
-            x = base_x - self.gap_px - 8
-            y = base_y + conn.edge_index * step + self.node_size_px // 2
-        return x, y
+                    pygame.draw.circle(surface, base_color, (sx, sy), r, width=max(1, int(2 * cam.zoom)))
+        return surface
 
     def _try_click_connector(self, screen_pos):
-        # Convert click to world and check proximity to any connector; if within radius, assign and reveal neighbor
+        # Nearest connector slot within the hit radius of a revealed cluster; assign it and reveal the neighbor
         wx, wy = self.camera.screen_to_world(*screen_pos)
-        for cluster in self.grid.visible_clusters():
-            base_x = cluster.cx * (self.cluster_size_px)
-            base_y = cluster.cy * (self.cluster_size_px)
-            for conn in cluster.connectors:
-                cx_world, cy_world = self._connector_world_pos(base_x, base_y, conn)
-                dist2 = (wx - cx_world) ** 2 + (wy - cy_world) ** 2
-                if dist2 <= (self.connector_radius * 2) ** 2:
-                    self.grid.reveal_neighbor_from_connector(cluster, conn)
-                    return True
+        for _, cx, cy, direction, edge_index in sorted(self.layout.connector_slots_at(wx, wy)):
+            cluster = self.grid.get_cluster(cx, cy)
+            conn = cluster.connector_at(direction, edge_index) if cluster is not None else None
+            if conn is not None:
+                self.grid.reveal_neighbor_from_connector(cluster, conn)
+                return True
         return False
 
     def _try_click_node(self, screen_pos):
         # Toggle assignment for clicked node (simple prototype; pathing rules to be added)
-        wx, wy = self.camera.screen_to_world(*screen_pos)
-        for cluster in self.grid.visible_clusters():
-            base_x = cluster.cx * (self.cluster_size_px)
-            base_y = cluster.cy * (self.cluster_size_px)
-            for iy in range(5):
-                for ix in range(5):
-                    nx = base_x + ix * (self.node_size_px + self.gap_px)
-                    ny = base_y + iy * (self.node_size_px + self.gap_px)
-                    if nx <= wx <= nx + self.node_size_px and ny <= wy <= ny + self.node_size_px:
-                        node = cluster.nodes[iy][ix]
-                        if not node.is_center:
-                            node.assigned = not node.assigned
-                        return
+        hit = self.layout.node_at(*self.camera.screen_to_world(*screen_pos))
+        if hit is None:
+            return
+        cx, cy, ix, iy = hit
+        cluster = self.grid.get_cluster(cx, cy)
+        if cluster is not None:
+            node = cluster.get_node(ix, iy)
+            if not node.is_center:
+                node.assigned = not node.assigned
@@ -1,7 +1,7 @@
 """Quick demo: generate items for each slot and attempt equip."""
+import logging
 import os
 import sys
-import random
 
 # Ensure project root is on sys.path when running from scripts/
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
@@ -11,8 +11,9 @@ from core.character import Character
 
 
 def main():
-    random.seed(123)
-    gen = ItemGenerator()
+    # show generator/equip diagnostics like the interactive CLI with --verbose
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+    gen = ItemGenerator(seed=123)
     char = Character("Demo")
 
     slots = ["Weapon","Offhand","Helmet","BodyArmor","Boots","Belt","Amulet","Ring"]
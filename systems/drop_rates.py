@@ -0,0 +1,163 @@
+"""Analytic drop probabilities.
+
+Follows ItemGenerator.generateItem step by step and reads the same weight
+tables, so every number here is the exact probability of the generator's
+outcome (up to float rounding), with no sampling:
+
+    rarity       rarity_weights(item_find) minus exclusions
+    base         catalog.base_table(ilvl, exclude, slot), i.e. the lvl_req
+                 window [ilvl - BASE_LVL_WINDOW, ilvl]
+    affix count  AFFIX_COUNTS steps for the rarity
+    affixes      one independent pick per affix from catalog.affix_table(type, base slot)
+    exceptional  EXCEPTIONAL_WEIGHTS
+    values       round((hi - lo) * ilvl / 100 * roll + lo), roll uniform in [0, 1)
+
+Results are keyed like SimulationResult (catalog keys), so they can be
+compared with `simulate` output directly.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+from core.items.catalog import Catalog, get_catalog
+from systems.item_generator import AFFIX_COUNTS, EXCEPTIONAL_WEIGHTS, rarity_weights
+
+AFFIX_TYPES = ("Prefix", "Suffix")
+
+
+def _keys(mapping):
+    # catalog entry -> catalog key (keys and entry names may differ)
+    return {id(entry): key for key, entry in mapping.items()}
+
+
+def _table_probabilities(table, keys) -> Dict[str, float]:
+    probabilities = {}
+    previous = 0
+    for entry, cum in zip(table.items, table.cum_weights):
+        key = keys[id(entry)]
+        probabilities[key] = probabilities.get(key, 0.0) + (cum - previous) / table.total
+        previous = cum
+    return probabilities
+
+
+def rarity_probabilities(item_find=0, exclude=()) -> Dict[str, float]:
+    """P(rarity) for ItemGenerator.random_rarity."""
+    weights = [(name, w) for name, w in rarity_weights(item_find) if name not in exclude]
+    total = sum(w for _, w in weights)
+    return {name: w / total for name, w in weights} if total else {}
+
+
+def base_probabilities(ilvl, slot="random", exclude=(), catalog: Catalog | None = None) -> Dict[str, float]:
+    """P(base | ilvl, slot) for a random base type."""
+    catalog = catalog or get_catalog()
+    table = catalog.base_table(ilvl, exclude, slot)
+    return _table_probabilities(table, _keys(catalog.bases)) if len(table) else {}
+
+
+def affix_count_probabilities(rarity) -> Dict[Tuple[int, int], float]:
+    """P((prefixes, suffixes)) for a rarity; rarities without affixes roll (0, 0)."""
+    probabilities = {}
+    previous = 0.0
+    for bound, prefixes, suffixes in AFFIX_COUNTS.get(rarity, []):
+        key = (prefixes, suffixes)
+        probabilities[key] = probabilities.get(key, 0.0) + bound - previous
+        previous = bound
+    return probabilities or {(0, 0): 1.0}
+
+
+def affix_pick_probabilities(affix_type, gear_slot, catalog: Catalog | None = None) -> Dict[str, float]:
+    """P(affix) for a single create_random_affix pick on a gear slot."""
+    catalog = catalog or get_catalog()
+    table = catalog.affix_table(affix_type, gear_slot)
+    return _table_probabilities(table, _keys(catalog.affixes)) if len(table) else {}
+
+
+def exceptional_probability() -> float:
+    return EXCEPTIONAL_WEIGHTS[1] / sum(EXCEPTIONAL_WEIGHTS)
+
+
+def value_distribution(affix, ilvl, stat="x") -> Dict[int, float]:
+    """
+    P(rolled value) of an affix entry at ilvl for stat "x", "y" or "z".
+    Each value v owns the roll interval that rounds to it; the probability
+    of hitting an exact .5 tie (about 2**-53 per value) is ignored.
+    """
+    value_range = affix.get(f"{stat}Range")
+    lo, hi = value_range[0], value_range[-1]
+    scale = (hi - lo) * ilvl / 100
+    if scale == 0:
+        return {round(lo): 1.0}
+    first, last = sorted((lo, scale + lo))
+    distribution = {}
+    for v in range(math.floor(first + 0.5) - 1, math.ceil(last + 0.5) + 1):
+        # rolls whose value lands in [v - 0.5, v + 0.5)
+        a, b = sorted(((v - 0.5 - lo) / scale, (v + 0.5 - lo) / scale))
+        p = min(b, 1.0) - max(a, 0.0)
+        if p > 0:
+            distribution[v] = p
+    return distribution
+
+
+@dataclass
+class DropRates:
+    rarity: Dict[str, float] = field(default_factory=dict)
+    exceptional: float = 0.0
+    bases: Dict[str, float] = field(default_factory=dict)
+    # expected number of times each affix appears per item
+    affixes: Dict[str, float] = field(default_factory=dict)
+    # probability that an item carries the affix at least once
+    affix_chance: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self):
+        return {
+            "rarity": self.rarity,
+            "exceptional": self.exceptional,
+            "bases": self.bases,
+            "affixes": self.affixes,
+            "affix_chance": self.affix_chance,
+        }
+
+
+def drop_rates(ilvl=25, slot="random", rarity="random", item_find=0, exclude=(),
+               catalog: Catalog | None = None) -> DropRates:
+    """Exact per-item outcome probabilities of ItemGenerator.generateItem for Gear."""
+    catalog = catalog or get_catalog()
+    rarities = rarity_probabilities(item_find, exclude) if rarity == "random" else {rarity: 1.0}
+    table = catalog.base_table(ilvl, exclude, slot)
+    result = DropRates(rarity=rarities, exceptional=exceptional_probability())
+    if not len(table):
+        return result
+    result.bases = _table_probabilities(table, _keys(catalog.bases))
+
+    # slot of the rolled base -> probability
+    slots = {}
+    previous = 0
+    for entry, cum in zip(table.items, table.cum_weights):
+        slots[entry.get("slot")] = slots.get(entry.get("slot"), 0.0) + (cum - previous) / table.total
+        previous = cum
+
+    # (prefixes, suffixes) -> probability, over the rarity mix
+    counts = {}
+    for name, p_rarity in rarities.items():
+        for key, p in affix_count_probabilities(name).items():
+            counts[key] = counts.get(key, 0.0) + p_rarity * p
+
+    affix_keys = _keys(catalog.affixes)
+    for gear_slot, p_slot in slots.items():
+        for t, affix_type in enumerate(AFFIX_TYPES):
+            affix_table = catalog.affix_table(affix_type, gear_slot)
+            if not len(affix_table):
+                continue
+            picks = _table_probabilities(affix_table, affix_keys)
+            for key, q in picks.items():
+                expected = 0.0
+                chance = 0.0
+                for n_affixes, p_counts in counts.items():
+                    k = n_affixes[t]
+                    expected += p_counts * k * q
+                    chance += p_counts * (1 - (1 - q) ** k)
+                result.affixes[key] = result.affixes.get(key, 0.0) + p_slot * expected
+                result.affix_chance[key] = result.affix_chance.get(key, 0.0) + p_slot * chance
+    return result
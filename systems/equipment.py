@@ -1,4 +1,7 @@
-from typing import Optional
+import logging
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
 
 # Simple slot normalization to keep synonyms unified
 SLOT_ALIASES = {
@@ -11,38 +14,87 @@ def normalize_slot(slot: str) -> str:
     return SLOT_ALIASES.get(slot, slot)
 
 
+# (item attribute, default, character stat id or None for the level, reason),
+# in the order the checks are reported
+REQUIREMENTS = (
+    ("lvl_req", 1, None, "level restrictions"),
+    ("str_req", 0, "str", "Strength restrictions"),
+    ("int_req", 0, "int", "Intelligence restrictions"),
+    ("dex_req", 0, "dex", "Dexterity restrictions"),
+)
+
+
+def _character_limits(character):
+    return [getattr(character, "lvl", 1) if sid is None else character.get_stat_by_id(sid).total
+            for _, _, sid, _ in REQUIREMENTS]
+
+
 def check_requirements(character, gear_piece) -> Optional[str]:
     """Return None if ok, else an error reason string."""
-    # Level
-    if getattr(gear_piece, "lvl_req", 1) > getattr(character, "lvl", 1):
-        return "level restrictions"
-    # Strength
-    if getattr(gear_piece, "str_req", 0) > character.get_stat_by_id("str").total:
-        return "Strength restrictions"
-    # Intelligence
-    if getattr(gear_piece, "int_req", 0) > character.get_stat_by_id("int").total:
-        return "Intelligence restrictions"
-    # Dexterity
-    if getattr(gear_piece, "dex_req", 0) > character.get_stat_by_id("dex").total:
-        return "Dexterity restrictions"
+    for (attr, default, _, reason), limit in zip(REQUIREMENTS, _character_limits(character)):
+        if getattr(gear_piece, attr, default) > limit:
+            return reason
     return None
 
 
+def check_requirements_bulk(character, items) -> List[Optional[str]]:
+    """
+    check_requirements for many items in one pass (requires NumPy).
+    Item requirements already include req_red/lvl_req_red. Returns one
+    reason (or None) per item, in the same priority order.
+    """
+    import numpy as np
+
+    items = list(items)
+    if not items:
+        return []
+    reqs = np.array([[getattr(item, attr, default) for attr, default, _, _ in REQUIREMENTS] for item in items],
+                    dtype=np.float64)
+    failed = reqs > np.array(_character_limits(character), dtype=np.float64)
+    first = failed.argmax(axis=1)
+    reasons = [reason for _, _, _, reason in REQUIREMENTS]
+    return [reasons[f] if bad else None for f, bad in zip(first.tolist(), failed.any(axis=1).tolist())]
+
+
+def best_in_slot(character, items, scorer: Callable) -> Dict[str, object]:
+    """
+    Returns the highest scoring equippable item per (normalized) slot.
+    Items failing requirements or without a matching equipment slot are
+    skipped; ties keep the earlier item.
+    """
+    items = list(items)
+    best = {}
+    for item, reason in zip(items, check_requirements_bulk(character, items)):
+        if reason is not None:
+            continue
+        slot = normalize_slot(getattr(item, "slot", "unknown"))
+        if slot not in character.equipment:
+            continue
+        score = scorer(item)
+        if slot not in best or score > best[slot][0]:
+            best[slot] = (score, item)
+    return {slot: item for slot, (_, item) in best.items()}
+
+
 def equip(character, gear_piece) -> bool:
     """Attempt to equip a gear piece on character. Returns True on success."""
     reason = check_requirements(character, gear_piece)
     if reason is not None:
-        print(f"Player cannot equip \"{gear_piece.name}\" due to its {reason}")
+        logger.info("Player cannot equip \"%s\" due to its %s", gear_piece.name, reason)
         return False
 
-    print(f"Player equips \"{gear_piece.name}\"")
+    logger.info("Player equips \"%s\"", gear_piece.name)
     slot = normalize_slot(getattr(gear_piece, "slot", "unknown"))
     if slot not in character.equipment:
         # Unknown slot, abort equip
-        print(f"Unknown slot '{slot}' for item {gear_piece.name}")
+        logger.warning("Unknown slot '%s' for item %s", slot, gear_piece.name)
         return False
 
+    # swap out the previous piece; only the stats its boni touch change
+    if character.equipment[slot] is not None:
+        unequip(character, slot)
     character.equipment[slot] = gear_piece
+    character.apply_gear_boni(slot, gear_piece)
     return True
 
 
@@ -51,7 +103,8 @@ def unequip(character, gear_slot: str) -> bool:
     item = character.equipment.get(slot)
     if item is None:
         return False
-    print(f"Unequipping {item.name}")
+    logger.info("Unequipping %s", item.name)
+    character.retract_gear_boni(slot)
     character.inventory.append(item)
     character.equipment[slot] = None
     return True
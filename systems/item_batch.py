@@ -0,0 +1,163 @@
+"""Vectorized (NumPy) bulk item generation.
+
+Rolls whole batches of gear at once and keeps the result columnar: ids into
+the catalog plus rolled values. Gear objects are only built on request.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.items.affixes import Affix
+from core.items.bases import BaseType
+from core.items.catalog import Catalog, WeightedTable
+from core.items.gear import Gear
+
+RARITIES = ("Normal", "Magic", "Rare")
+AFFIX_TYPES = ("Prefix", "Suffix")
+
+
+@dataclass
+class ItemBatch:
+    """
+    Columnar record of generated gear.
+
+    Affix columns are [prefix 0, prefix 1, suffix 0, suffix 1]; unused
+    columns hold -1 in affix_ids and 0 in rolls/x_values.
+    """
+    catalog: Catalog
+    ilvl: int
+    rarity: np.ndarray       # (n,) uint8, index into RARITIES
+    base_ids: np.ndarray     # (n,) int32, index into catalog.bases
+    exceptional: np.ndarray  # (n,) bool
+    affix_ids: np.ndarray    # (n, 4) int32, index into catalog.affixes or -1
+    rolls: np.ndarray        # (n, 4) float64, value roll in [0, 1)
+    x_values: np.ndarray     # (n, 4) int32, rolled xValue
+
+    def __len__(self):
+        return len(self.base_ids)
+
+    def gear(self, i: int) -> Gear:
+        """Materializes item i as a Gear object."""
+        base_entries = list(self.catalog.bases.values())
+        affix_entries = list(self.catalog.affixes.values())
+        return self._build(i, base_entries, affix_entries)
+
+    def iter_gear(self):
+        base_entries = list(self.catalog.bases.values())
+        affix_entries = list(self.catalog.affixes.values())
+        for i in range(len(self)):
+            yield self._build(i, base_entries, affix_entries)
+
+    def _build(self, i, base_entries, affix_entries) -> Gear:
+        base = BaseType(base_entries[self.base_ids[i]], self.ilvl)
+        rolled = []
+        for col in range(4):
+            aid = self.affix_ids[i, col]
+            rolled.append(None if aid < 0 else Affix(affix_entries[aid], self.ilvl, roll=float(self.rolls[i, col])))
+        prefixes = [a for a in rolled[:2] if a is not None]
+        suffixes = [a for a in rolled[2:] if a is not None]
+        return Gear(rarity=RARITIES[self.rarity[i]], base=base, exceptional=bool(self.exceptional[i]),
+                    prefixes=prefixes, suffixes=suffixes)
+
+
+def _table_arrays(table: WeightedTable, positions):
+    ids = np.fromiter((positions[id(e)] for e in table.items), dtype=np.int32, count=len(table))
+    return ids, np.asarray(table.cum_weights, dtype=np.float64), table.total
+
+
+def _pick(rng, cum, total, size):
+    # same rule as WeightedTable.pick / random.choices: bisect right, clamp to last
+    idx = np.searchsorted(cum, rng.random(size) * total, side="right")
+    return np.minimum(idx, len(cum) - 1)
+
+
+def generate_batch(catalog: Catalog, count: int, ilvl=25, slot="random", rarity="random",
+                   seed=None, item_find=0, exclude=()) -> ItemBatch:
+    """
+    Rolls `count` gear items with the same rules as ItemGenerator.generateItem.
+    `seed` may be anything np.random.default_rng accepts (int, SeedSequence,
+    Generator).
+    """
+    # imported here: item_generator imports this module lazily
+    from systems.item_generator import AFFIX_COUNTS, EXCEPTIONAL_WEIGHTS, rarity_weights
+
+    rng = np.random.default_rng(seed)
+    n = int(count)
+    base_positions = {id(b): i for i, b in enumerate(catalog.bases.values())}
+    affix_positions = {id(a): i for i, a in enumerate(catalog.affixes.values())}
+
+    # rarity
+    if rarity == "random":
+        weights = [(name, w) for name, w in rarity_weights(item_find) if name not in exclude]
+        codes = np.array([RARITIES.index(name) for name, _ in weights], dtype=np.uint8)
+        cum = np.cumsum([w for _, w in weights], dtype=np.float64)
+        rarity_codes = codes[_pick(rng, cum, cum[-1], n)]
+    else:
+        rarity_codes = np.full(n, RARITIES.index(rarity), dtype=np.uint8)
+
+    # base type
+    table = catalog.base_table(ilvl, exclude, slot)
+    if not len(table):
+        raise IndexError(f"No base types available for slot {slot!r} at ilvl {ilvl}")
+    ids, cum, total = _table_arrays(table, base_positions)
+    base_ids = ids[_pick(rng, cum, total, n)]
+
+    # number of prefixes/suffixes per item
+    ran = rng.random(n)
+    n_prefixes = np.zeros(n, dtype=np.int8)
+    n_suffixes = np.zeros(n, dtype=np.int8)
+    for code, name in enumerate(RARITIES):
+        steps = AFFIX_COUNTS.get(name)
+        if not steps:
+            continue
+        of_rarity = rarity_codes == code
+        bounds = np.array([bound for bound, _, _ in steps])
+        step = np.minimum(np.searchsorted(bounds, ran[of_rarity], side="left"), len(steps) - 1)
+        n_prefixes[of_rarity] = np.array([p for _, p, _ in steps], dtype=np.int8)[step]
+        n_suffixes[of_rarity] = np.array([s for _, _, s in steps], dtype=np.int8)[step]
+
+    # affix picks, grouped by the slot of the rolled base
+    affix_ids = np.full((n, 4), -1, dtype=np.int32)
+    base_entries = list(catalog.bases.values())
+    slot_names = list(dict.fromkeys(b.get("slot") for b in base_entries))
+    base_slot_codes = np.array([slot_names.index(b.get("slot")) for b in base_entries], dtype=np.int32)
+    item_slot_codes = base_slot_codes[base_ids]
+    for slot_code in np.flatnonzero(np.bincount(item_slot_codes, minlength=len(slot_names))):
+        gear_slot = slot_names[slot_code]
+        in_slot = np.flatnonzero(item_slot_codes == slot_code)
+        for t, affix_type in enumerate(AFFIX_TYPES):
+            wanted = (n_prefixes if affix_type == "Prefix" else n_suffixes)[in_slot]
+            affix_table = catalog.affix_table(affix_type, gear_slot)
+            if not len(affix_table):
+                continue
+            ids, cum, total = _table_arrays(affix_table, affix_positions)
+            for k in range(2):
+                rows = in_slot[wanted > k]
+                affix_ids[rows, 2 * t + k] = ids[_pick(rng, cum, total, len(rows))]
+
+    # value rolls: xValue = round((hi - lo) * ilvl / 100 * roll + lo)
+    has_affix = affix_ids >= 0
+    rolls = np.where(has_affix, rng.random((n, 4)), 0.0)
+    affix_entries = list(catalog.affixes.values())
+    lo = np.array([a["xRange"][0] for a in affix_entries], dtype=np.float64)
+    hi = np.array([a["xRange"][-1] for a in affix_entries], dtype=np.float64)
+    safe_ids = np.where(has_affix, affix_ids, 0)
+    span = (hi - lo)[safe_ids] * ilvl / 100
+    x_values = np.where(has_affix, np.rint(span * rolls + lo[safe_ids]), 0).astype(np.int32)
+
+    # exceptionality
+    exc_cum = np.cumsum(EXCEPTIONAL_WEIGHTS, dtype=np.float64)
+    exceptional = _pick(rng, exc_cum, exc_cum[-1], n) == 1
+
+    return ItemBatch(
+        catalog=catalog,
+        ilvl=ilvl,
+        rarity=rarity_codes,
+        base_ids=base_ids,
+        exceptional=exceptional,
+        affix_ids=affix_ids,
+        rolls=rolls,
+        x_values=x_values,
+    )
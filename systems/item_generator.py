@@ -1,14 +1,46 @@
+import logging
 import random as rand
+import sys
 from core.items.affixes import AffixLoader
 from core.items.bases import BaseTypeLoader
+from core.items.catalog import Catalog, WeightedTable, get_catalog
 from core.items.gear import Gear
 
+# Diagnostics go through logging with lazy %-args, so a disabled DEBUG level
+# costs one level check per call. The CLI's --verbose flag turns them on.
+logger = logging.getLogger(__name__)
+
+# (upper roll bound, prefixes, suffixes) per rarity; first bound >= roll wins
+AFFIX_COUNTS = {
+    "Magic": [(0.3, 1, 0), (0.6, 0, 1), (1.0, 1, 1)],
+    "Rare": [(0.4, 2, 1), (0.8, 1, 2), (1.0, 2, 2)],
+}
+
+# weights for [not exceptional, exceptional]
+EXCEPTIONAL_WEIGHTS = [100, 5]
+EXCEPTIONAL_TABLE = WeightedTable([False, True], EXCEPTIONAL_WEIGHTS)
+
+
+def rarity_weights(item_find=0):
+    return [
+        ["Normal", 100],
+        ["Magic", 20 * (1 + item_find)],
+        ["Rare", 10 * (1 + item_find)],
+        # Add other rarities here if you have them, e.g.,
+        # ["Unique", 1 * (1 + item_find)],
+    ]
+
 
 class ItemGenerator():
     
-    def __init__(self):
-        #rand.seed("eminaz")
-        _ = []
+    def __init__(self, catalog: Catalog | None = None, rng=None, seed=None):
+        # private random stream (random.Random or numpy Generator); anything with
+        # .random() works. Loaders share it, so a seed replays whole drops.
+        self.rng = rng if rng is not None else rand.Random(seed)
+        # loaders share one read-only catalog; no file I/O per item
+        self.catalog = catalog if catalog is not None else get_catalog()
+        self.affix_loader = AffixLoader(self.catalog, rng=self.rng)
+        self.baseType_loader = BaseTypeLoader(self.catalog, rng=self.rng)
             
     def random_category(self, category=None, exclude=[]):
         
@@ -29,24 +61,17 @@ class ItemGenerator():
         category_names = [cw[0] for cw in processed_category_weights]
         weights = [cw[1] for cw in processed_category_weights]
 
-        # Use random.choices for weighted selection
-        # k=1 means pick one item, [0] extracts it from the resulting list
-        random_category = rand.choices(category_names, weights=weights, k=1)[0]
+        # Weighted selection (same draw as random.choices) on the private stream
+        random_category = WeightedTable(category_names, weights).pick(self.rng)
                 
-        print(f"Selected category: {random_category}")        
+        logger.debug("Selected category: %s", random_category)
             
         return random_category
     
     
     def random_rarity(self, item_find=0, exclude=[]):
         
-        rarityWeights = [
-            ["Normal", 100],
-            ["Magic", 20 * (1 + item_find)],
-            ["Rare", 10 * (1 + item_find)],
-            # Add other rarities here if you have them, e.g.,
-            # ["Unique", 1 * (1 + item_find)],
-        ]
+        rarityWeights = rarity_weights(item_find)
     
         # Apply exclusions
         # This will return a list like [["Normal", 100], ["Magic", 200]]
@@ -56,11 +81,10 @@ class ItemGenerator():
         rarity_names = [rw[0] for rw in processed_rarity_weights]
         weights = [rw[1] for rw in processed_rarity_weights]
 
-        # Use random.choices for weighted selection
-        # k=1 means pick one item, [0] extracts it from the resulting list
-        randomized_rarity = rand.choices(rarity_names, weights=weights, k=1)[0]
+        # Weighted selection (same draw as random.choices) on the private stream
+        randomized_rarity = WeightedTable(rarity_names, weights).pick(self.rng)
 
-        print(f"\nSelected rarity: {randomized_rarity}")    
+        logger.debug("Selected rarity: %s", randomized_rarity)
         return randomized_rarity
         
     def random_potion(self, exclude=[]):    
@@ -80,11 +104,10 @@ class ItemGenerator():
         potion_type_names = [ptw[0] for ptw in processed_potion_type_weights]
         weights = [ptw[1] for ptw in processed_potion_type_weights]
 
-        # Use random.choices for weighted selection
-        # k=1 means pick one item, [0] extracts it from the resulting list
-        randomized_potion = rand.choices(potion_type_names, weights=weights, k=1)[0]
+        # Weighted selection (same draw as random.choices) on the private stream
+        randomized_potion = WeightedTable(potion_type_names, weights).pick(self.rng)
     
-        print(f"Selected potionType: {randomized_potion}")
+        logger.debug("Selected potionType: %s", randomized_potion)
     
         return randomized_potion
     
@@ -103,30 +126,17 @@ class ItemGenerator():
         number_of_prefixes = 0
         number_of_suffixes = 0
         
-        ran = rand.random()
+        ran = self.rng.random()
             
-        if rarity == "Magic":
-            if ran <= 0.3:
-                number_of_prefixes = 1
-            elif 0.3 < ran and ran <= 0.6:
-                number_of_suffixes = 1
-            elif 0.6 < ran:
-                number_of_prefixes = 1
-                number_of_suffixes = 1
-            
-        elif rarity == "Rare":
-            if ran <= 0.4:
-                number_of_prefixes = 2
-                number_of_suffixes = 1
-            elif 0.4 < ran and ran <= 0.8:
-                number_of_prefixes = 1
-                number_of_suffixes = 2
-            elif 0.8 < ran:
-                number_of_prefixes = 2
-                number_of_suffixes = 2
+        for bound, prefix_count, suffix_count in AFFIX_COUNTS.get(rarity, []):
+            if ran <= bound:
+                number_of_prefixes = prefix_count
+                number_of_suffixes = suffix_count
+                break
     
-        # roll affixes
-        affixLoader = AffixLoader()
+        # roll affixes (used affixes are tracked per item)
+        affixLoader = self.affix_loader
+        affixLoader.used_affixes.clear()
         
         #print(f"Prefixes: {number_of_prefixes} | Suffixes: {number_of_suffixes}\n")
         
@@ -148,13 +158,23 @@ class ItemGenerator():
     def random_baseType(self, ilvl, exclude, gearSlot="random"):
         
         # roll baseType
-        baseTypeLoader = BaseTypeLoader()
+        baseTypeLoader = self.baseType_loader
         baseType = baseTypeLoader.create_random_baseType(ilvl, exclude, gearSlot)
         
         #print(f"\nSelected baseType: {baseType}")
     
         return baseType
             
+    def generate_batch(self, count, ilvl=25, slot="random", rarity="random", seed=None, item_find=0, exclude=[]):
+        """
+        Vectorized bulk generation of gear (requires NumPy).
+        Returns a columnar ItemBatch; use batch.gear(i) / batch.iter_gear()
+        to materialize Gear objects on demand.
+        """
+        from systems.item_batch import generate_batch
+        return generate_batch(self.catalog, count, ilvl=ilvl, slot=slot, rarity=rarity,
+                              seed=seed, item_find=item_find, exclude=exclude)
+
     # Name is derived in Gear; legacy method removed for clarity.
     
     
@@ -175,14 +195,14 @@ class ItemGenerator():
         suffixes = []
         exceptional = False
         
-        print("\nGenerating new item:",
-              "\n- item level:", ilvl,
-              "\n- category:", category,
-              "\n- gearSlot:", gearSlot,
-              "\n- rarity:", rarity,
-              "\n- base type:", baseType,
-              "\n- potion type:", potionType,
-              )
+        logger.debug("\nGenerating new item:"
+                     "\n- item level: %s"
+                     "\n- category: %s"
+                     "\n- gearSlot: %s"
+                     "\n- rarity: %s"
+                     "\n- base type: %s"
+                     "\n- potion type: %s",
+                     ilvl, category, gearSlot, rarity, baseType, potionType)
         
         # category
         if category == "random":
@@ -202,7 +222,7 @@ class ItemGenerator():
             prefixes, suffixes = self.random_affixes(rarity, ilvl, base)
             
             # exceptionality
-            exceptional = rand.choices([False, True], weights=[100, 5])[0]
+            exceptional = EXCEPTIONAL_TABLE.pick(self.rng)
             
             # create gear
             item = Gear(rarity=rarity, base=base, exceptional=exceptional, prefixes=prefixes, suffixes=suffixes)
@@ -221,28 +241,96 @@ class ItemGenerator():
             
         if category == "Gold":
             # Roll gold amount (function of ilvl)
-            gold_amount = round(1 + rand.random() * 20 * ilvl)
-            print(f"Gold amount: {gold_amount}")
+            gold_amount = round(1 + self.rng.random() * 20 * ilvl)
+            logger.debug("Gold amount: %s", gold_amount)
+
+
+def _print_simulation(result, top=10):
+    total = max(result.count, 1)
+    print(f"Simulated items: {result.count}")
+    print("\nRarity:")
+    for name, n in result.rarity.most_common():
+        print(f"- {name:<{10}} {n:>{12}} ({n / total:.4%})")
+    print(f"- {'Exceptional':<{10}} {result.exceptional:>{12}} ({result.exceptional / total:.4%})")
+    print("\nBase types:")
+    for name, n in result.bases.most_common(top):
+        print(f"- {name:<{20}} {n:>{12}} ({n / total:.4%})")
+    print("\nAffixes:")
+    for name, n in result.affixes.most_common(top):
+        hist = result.values.get(name, {})
+        mean = sum(v * c for v, c in hist.items()) / max(sum(hist.values()), 1)
+        print(f"- {name:<{20}} {n:>{12}} | values {min(hist, default=0)}..{max(hist, default=0)} | mean {mean:.2f}")
+
+
+def _print_rates(rates, top=10):
+    print("Rarity:")
+    for name, p in sorted(rates.rarity.items(), key=lambda kv: -kv[1]):
+        print(f"- {name:<{10}} {p:.4%}")
+    print(f"- {'Exceptional':<{10}} {rates.exceptional:.4%}")
+    print("\nBase types:")
+    for name, p in sorted(rates.bases.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"- {name:<{20}} {p:.4%}")
+    print("\nAffixes (expected per item | chance on an item):")
+    for name, n in sorted(rates.affixes.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"- {name:<{20}} {n:.4f} | {rates.affix_chance[name]:.4%}")
 
 
 def main(argv=None):
     import argparse
-    import random
+    import json
+    slot_choices = ["random","Weapon","Offhand","Helmet","BodyArmor","Boots","Belt","Amulet","Ring"]
+    rarity_choices = ["random","Normal","Magic","Rare"]
     parser = argparse.ArgumentParser(description="Generate items for testing")
-    parser.add_argument("--slot", dest="slot", default="random", choices=[
-        "random","Weapon","Offhand","Helmet","BodyArmor","Boots","Belt","Amulet","Ring"
-    ], help="Gear slot to target")
+    parser.add_argument("--slot", dest="slot", default="random", choices=slot_choices, help="Gear slot to target")
     parser.add_argument("--ilvl", dest="ilvl", type=int, default=1, help="Item level")
-    parser.add_argument("--rarity", dest="rarity", default="random", choices=["random","Normal","Magic","Rare"], help="Item rarity")
+    parser.add_argument("--rarity", dest="rarity", default="random", choices=rarity_choices, help="Item rarity")
     parser.add_argument("--count", dest="count", type=int, default=1, help="How many to generate")
     parser.add_argument("--seed", dest="seed", type=int, default=None, help="Random seed for reproducibility")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print generation diagnostics")
+
+    commands = parser.add_subparsers(dest="command")
+    sim = commands.add_parser("simulate", help="Multi-process loot simulation (histograms only)")
+    sim.add_argument("--count", dest="count", type=int, default=1_000_000, help="How many items to simulate")
+    sim.add_argument("--workers", dest="workers", type=int, default=1, help="Worker processes")
+    sim.add_argument("--seed", dest="seed", type=int, default=None, help="Master seed; results do not depend on --workers")
+    sim.add_argument("--slot", dest="slot", default="random", choices=slot_choices, help="Gear slot to target")
+    sim.add_argument("--ilvl", dest="ilvl", type=int, default=25, help="Item level")
+    sim.add_argument("--rarity", dest="rarity", default="random", choices=rarity_choices, help="Item rarity")
+    sim.add_argument("--item-find", dest="item_find", type=float, default=0, help="Item find bonus")
+    sim.add_argument("--chunk-size", dest="chunk_size", type=int, default=None, help="Items per work unit")
+    sim.add_argument("--json", dest="json_path", default=None, help="Also write the histograms to this JSON file")
+    rates = commands.add_parser("rates", help="Exact per-item drop probabilities (no sampling)")
+    rates.add_argument("--slot", dest="slot", default="random", choices=slot_choices, help="Gear slot to target")
+    rates.add_argument("--ilvl", dest="ilvl", type=int, default=25, help="Item level")
+    rates.add_argument("--rarity", dest="rarity", default="random", choices=rarity_choices, help="Item rarity")
+    rates.add_argument("--item-find", dest="item_find", type=float, default=0, help="Item find bonus")
+    rates.add_argument("--json", dest="json_path", default=None, help="Also write the probabilities to this JSON file")
     args = parser.parse_args(argv)
 
-    if args.seed is not None:
-        random.seed(args.seed)
-        rand.seed(args.seed)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING,
+                        format="%(message)s", stream=sys.stdout)
+
+    if args.command == "simulate":
+        from systems.simulation import DEFAULT_CHUNK_SIZE, simulate
+        result = simulate(args.count, workers=args.workers, seed=args.seed, ilvl=args.ilvl, slot=args.slot,
+                          rarity=args.rarity, item_find=args.item_find,
+                          chunk_size=args.chunk_size or DEFAULT_CHUNK_SIZE)
+        _print_simulation(result)
+        if args.json_path:
+            with open(args.json_path, "w") as f:
+                json.dump(result.to_dict(), f, indent=2)
+        return
+
+    if args.command == "rates":
+        from systems.drop_rates import drop_rates
+        result = drop_rates(ilvl=args.ilvl, slot=args.slot, rarity=args.rarity, item_find=args.item_find)
+        _print_rates(result)
+        if args.json_path:
+            with open(args.json_path, "w") as f:
+                json.dump(result.to_dict(), f, indent=2)
+        return
 
-    gen = ItemGenerator()
+    gen = ItemGenerator(seed=args.seed)
     for i in range(args.count):
         item = gen.generateItem(ilvl=args.ilvl, category="Gear", rarity=args.rarity, gearSlot=args.slot)
         print(item.to_tooltip())
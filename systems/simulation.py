@@ -0,0 +1,103 @@
+"""Multi-process loot simulation.
+
+Work is cut into fixed-size chunks. Chunk i always draws from the seed
+SeedSequence(seed, spawn_key=(i,)), so the totals depend only on the master
+seed and chunk size, never on how many workers ran. Workers send back
+histograms, not Gear objects.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict
+
+import numpy as np
+
+from core.items.catalog import get_catalog
+from systems.item_batch import RARITIES, generate_batch
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+@dataclass
+class SimulationResult:
+    count: int = 0
+    rarity: Counter = field(default_factory=Counter)
+    exceptional: int = 0
+    bases: Counter = field(default_factory=Counter)
+    affixes: Counter = field(default_factory=Counter)
+    # affix name -> Counter(rolled xValue -> occurrences)
+    values: Dict[str, Counter] = field(default_factory=dict)
+
+    def merge(self, other: "SimulationResult") -> "SimulationResult":
+        self.count += other.count
+        self.rarity.update(other.rarity)
+        self.exceptional += other.exceptional
+        self.bases.update(other.bases)
+        self.affixes.update(other.affixes)
+        for name, hist in other.values.items():
+            self.values.setdefault(name, Counter()).update(hist)
+        return self
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "rarity": dict(self.rarity),
+            "exceptional": self.exceptional,
+            "bases": dict(self.bases),
+            "affixes": dict(self.affixes),
+            "values": {name: {str(v): n for v, n in sorted(hist.items())} for name, hist in self.values.items()},
+        }
+
+
+def _count(names, codes, length):
+    counts = np.bincount(codes, minlength=length)
+    return Counter({names[i]: int(counts[i]) for i in np.flatnonzero(counts)})
+
+
+def _simulate_chunk(entropy, index, count, ilvl, slot, rarity, item_find) -> SimulationResult:
+    catalog = get_catalog()
+    seed = np.random.SeedSequence(entropy, spawn_key=(index,))
+    batch = generate_batch(catalog, count, ilvl=ilvl, slot=slot, rarity=rarity, seed=seed, item_find=item_find)
+
+    base_names = list(catalog.bases)
+    affix_names = list(catalog.affixes)
+    result = SimulationResult(count=count)
+    result.rarity = _count(RARITIES, batch.rarity, len(RARITIES))
+    result.exceptional = int(batch.exceptional.sum())
+    result.bases = _count(base_names, batch.base_ids, len(base_names))
+
+    ids = batch.affix_ids.ravel()
+    rolled = ids >= 0
+    ids = ids[rolled]
+    values = batch.x_values.ravel()[rolled]
+    result.affixes = _count(affix_names, ids, len(affix_names))
+    for aid in np.unique(ids):
+        affix_values = values[ids == aid]
+        low = int(affix_values.min())
+        counts = np.bincount(affix_values - low)
+        result.values[affix_names[aid]] = Counter({low + int(v): int(counts[v]) for v in np.flatnonzero(counts)})
+    return result
+
+
+def simulate(count, workers=1, seed=None, ilvl=25, slot="random", rarity="random", item_find=0,
+             chunk_size=DEFAULT_CHUNK_SIZE) -> SimulationResult:
+    """
+    Generates `count` items across `workers` processes and returns the merged
+    histograms. Results are identical for the same seed and chunk_size.
+    """
+    entropy = np.random.SeedSequence(seed).entropy
+    chunks = [(i, min(chunk_size, count - start)) for i, start in enumerate(range(0, count, chunk_size))]
+    args = [(entropy, i, n, ilvl, slot, rarity, item_find) for i, n in chunks]
+
+    result = SimulationResult()
+    if workers <= 1 or len(args) <= 1:
+        for a in args:
+            result.merge(_simulate_chunk(*a))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_simulate_chunk, *zip(*args)):
+            result.merge(part)
+    return result